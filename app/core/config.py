@@ -15,7 +15,16 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 15
     refresh_token_expire_minutes: int = 60 * 24 * 7
     database_url: str = "sqlite+aiosqlite:///./app.db"
+    database_pool_size: int = 20
+    database_max_overflow: int = 30
+    database_pool_timeout: int = 30
+    database_pool_recycle: int = 3600
     openai_api_key: str | None = None
+    summarization_preload: bool = False
+    password_hash_time_cost: int = 2
+    password_hash_memory_cost: int = 65536
+    password_hash_target_ms: int | None = None
+    privacy_salt: str = ""
 
 
 @lru_cache
@@ -10,26 +10,27 @@ from app.ai.summary import OpenAISummarizationService, SummarizationService
 from app.core.config import get_settings
 from app.core.security import decode_token
 from app.models.database import get_session
-from app.models.user import User
-from app.services.users import get_user_by_email
+from app.services.users import get_user_id_by_email
 
 
 http_bearer = HTTPBearer(auto_error=False)
 
 
-async def get_current_user(
+async def get_current_user_id(
     credentials: HTTPAuthorizationCredentials | None = Depends(http_bearer),
     session: AsyncSession = Depends(get_session),
-) -> User:
-    """Resolve the authenticated user from a bearer token.
+) -> int:
+    """Resolve the authenticated user's identifier from a bearer token.
+
+    Only the user's id is looked up; the full row is not loaded.
 
     Args:
         credentials: Bearer token credentials extracted from the request. If
             ``None``, an authentication error is raised.
-        session: Database session used to load the user.
+        session: Database session used to look up the user.
 
     Returns:
-        User: The authenticated user associated with the provided token.
+        int: Identifier of the user associated with the provided token.
 
     Raises:
         HTTPException: Raised when the credentials are missing, invalid, or the
@@ -37,18 +38,17 @@ async def get_current_user(
     """
     if credentials is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
-    token = credentials.credentials
     try:
-        payload = decode_token(token, expected_type="access")
+        payload = decode_token(credentials.credentials, expected_type="access")
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(exc)) from exc
-    user = await get_user_by_email(session, payload.sub)
-    if user is None:
+    user_id = await get_user_id_by_email(session, payload.sub)
+    if user_id is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
         )
-    return user
+    return user_id
 
 
 @lru_cache
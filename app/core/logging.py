@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import atexit
 import contextvars
 import json
 import logging
+import queue
 import sys
+import threading
+import time
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable
 
 try:  # pragma: no cover - executed only when structlog is available at runtime
     import structlog as _structlog
@@ -15,14 +18,141 @@ except ModuleNotFoundError:  # pragma: no cover - fallback when structlog is abs
 
 structlog: Any | None = _structlog
 
+try:  # pragma: no cover - executed only when orjson is available at runtime
+    import orjson as _orjson
+except ModuleNotFoundError:  # pragma: no cover - fallback when orjson is absent
+    _orjson = None  # type: ignore[assignment]
+
+
+def _dumps(payload: Any, default: Callable[[Any], Any] = str) -> str:
+    """Serialize a log payload to JSON, preferring orjson when installed.
+
+    Args:
+        payload: Log event dictionary to serialize.
+        default: Callable used to coerce values that are not JSON serializable.
+
+    Returns:
+        str: JSON document describing the log event.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(payload, default=default, option=_orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # orjson rejects integers wider than 64 bits and unusual key types,
+            # which the standard library still serializes.
+            pass
+    return json.dumps(payload, default=default)
+
+
 _REQUEST_CONTEXT: contextvars.ContextVar[dict[str, Any]] = contextvars.ContextVar(
     "request_context", default={}
 )
 
+_LogRecord = tuple[logging.Logger, int, dict[str, Any]]
+
+_LOG_QUEUE: queue.SimpleQueue[_LogRecord | None] = queue.SimpleQueue()
+_LOG_WRITER: threading.Thread | None = None
+_LOG_WRITER_LOCK = threading.Lock()
+
+_LEVEL_NAMES = {
+    logging.DEBUG: "debug",
+    logging.INFO: "info",
+    logging.WARNING: "warning",
+    logging.ERROR: "error",
+    logging.CRITICAL: "critical",
+}
+_TIMESTAMP_PREFIX: tuple[int, str] = (-1, "")
+
+
+def _format_timestamp(timestamp: float) -> str:
+    """Render an epoch timestamp as an ISO-8601 UTC string.
+
+    The second-resolution prefix is reused while consecutive records fall
+    within the same second, leaving only the microseconds to format.
+
+    Args:
+        timestamp: Seconds since the epoch as returned by ``time.time()``.
+
+    Returns:
+        str: Timestamp formatted like ``datetime.isoformat`` in UTC.
+    """
+    global _TIMESTAMP_PREFIX
+    seconds = int(timestamp)
+    cached_seconds, prefix = _TIMESTAMP_PREFIX
+    if seconds != cached_seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _TIMESTAMP_PREFIX = (seconds, prefix)
+    microseconds = int((timestamp - seconds) * 1_000_000)
+    return f"{prefix}.{microseconds:06d}+00:00"
+
+
+def _ensure_log_writer() -> None:
+    """Start the background thread that serializes fallback log records."""
+
+    global _LOG_WRITER
+    if _LOG_WRITER is not None:
+        return
+    with _LOG_WRITER_LOCK:
+        if _LOG_WRITER is not None:
+            return
+        writer = threading.Thread(target=_drain_log_queue, name="fallback-log-writer", daemon=True)
+        writer.start()
+        atexit.register(_stop_log_writer, writer)
+        _LOG_WRITER = writer
+
+
+def _drain_log_queue() -> None:
+    """Serialize and emit queued log records in batches until stopped."""
+
+    while True:
+        records = [_LOG_QUEUE.get()]
+        while True:
+            try:
+                records.append(_LOG_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+        for record in records:
+            if record is None:
+                return
+            try:
+                _emit_log_record(*record)
+            except Exception as exc:  # one bad record must not stop the writer
+                sys.stderr.write(f"fallback-log-writer: dropped log record: {exc!r}\n")
+
+
+def _emit_log_record(target: logging.Logger, level: int, payload: dict[str, Any]) -> None:
+    """Serialize one queued record and hand it to its logger.
+
+    Payloads the regular serializer cannot render are retried with every
+    unknown value stringified before the record is given up on.
+
+    Args:
+        target: Logger the record was created for.
+        level: Numeric logging level.
+        payload: Snapshot of the event and its context.
+    """
+    payload["timestamp"] = _format_timestamp(payload["timestamp"])
+    try:
+        message = _dumps(payload)
+    except Exception:  # fall back to a lossy but safe rendering
+        message = json.dumps(payload, default=str, skipkeys=True)
+    target.log(level, message)
+
+
+def _stop_log_writer(writer: threading.Thread) -> None:
+    """Flush pending log records and stop the writer thread at exit."""
+
+    _LOG_QUEUE.put(None)
+    writer.join(timeout=5)
+
 
 @dataclass
 class _FallbackLogger:
-    """Provide a structlog-like interface backed by ``logging.Logger``."""
+    """Provide a structlog-like interface backed by ``logging.Logger``.
+
+    Records are snapshotted on the calling thread and serialized by a
+    background writer so JSON encoding and I/O stay off the event loop.
+    """
 
     name: str | None
     _context: dict[str, Any] = field(default_factory=dict)
@@ -43,18 +173,19 @@ class _FallbackLogger:
         return _FallbackLogger(self.name, combined)
 
     def _log(self, level: int, event: str, **kwargs: Any) -> None:
-        contextual_data = dict(_REQUEST_CONTEXT.get())
-        contextual_data.update(self._context)
+        if not self._logger.isEnabledFor(level):
+            return
         payload = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": time.time(),
             "logger": self.name or "app",
-            "level": logging.getLevelName(level).lower(),
+            "level": _LEVEL_NAMES.get(level) or logging.getLevelName(level).lower(),
             "event": event,
-            **contextual_data,
+            **_REQUEST_CONTEXT.get(),
+            **self._context,
             **kwargs,
         }
-        message = json.dumps(payload, default=str)
-        self._logger.log(level, message)
+        _ensure_log_writer()
+        _LOG_QUEUE.put((self._logger, level, payload))
 
     def info(self, event: str, **kwargs: Any) -> None:
         """Log an informational event."""
@@ -77,9 +208,14 @@ class _FallbackLogger:
         self._log(logging.DEBUG, event, **kwargs)
 
 
+_LOGGING_CONFIGURED = False
+
+
 def configure_logging() -> None:
     """Configure structured logging using structlog when available."""
 
+    global _LOGGING_CONFIGURED
+    _LOGGING_CONFIGURED = True
     logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout, force=True)
     if structlog is None:
         return
@@ -93,7 +229,7 @@ def configure_logging() -> None:
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.EventRenamer(to="message"),
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_dumps),
         ],
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
@@ -101,8 +237,15 @@ def configure_logging() -> None:
 
 
 def get_logger(name: str | None = None) -> Any:
-    """Return a structlog logger or a JSON-emitting fallback."""
+    """Return a structlog logger or a JSON-emitting fallback.
+
+    Logging is configured on first call so that module-level loggers are
+    always created after ``structlog.configure`` and are cached on first use
+    with the application processors rather than structlog's defaults.
+    """
 
+    if not _LOGGING_CONFIGURED:
+        configure_logging()
     if structlog is None:
         return _FallbackLogger(name)
     if name is None:
@@ -120,9 +263,9 @@ def bind_contextvars(**kwargs: Any) -> None:
     if structlog is not None:
         structlog.contextvars.bind_contextvars(**kwargs)
         return
-    current = dict(_REQUEST_CONTEXT.get())
-    current.update(kwargs)
-    _REQUEST_CONTEXT.set(current)
+    # Copy on write: tasks spawned from a request share its context by
+    # reference, so updating the dict in place would leak fields across them.
+    _REQUEST_CONTEXT.set({**_REQUEST_CONTEXT.get(), **kwargs})
 
 
 def clear_contextvars() -> None:
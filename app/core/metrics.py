@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import threading
 import time
-from collections import defaultdict
-from typing import Any, Awaitable, Callable, Iterable
+from array import array
+from bisect import bisect_left
+from typing import Any, Iterable
 
 try:  # pragma: no cover - executed when prometheus_client is installed
     from prometheus_client import CONTENT_TYPE_LATEST, Histogram, generate_latest
@@ -23,8 +25,22 @@ except ModuleNotFoundError:  # pragma: no cover - fallback when dependency is ab
 
             self._histogram._observe(self._labels, value)
 
+    class _HistogramShard:
+        """Bucket counts and running sum written by a single thread."""
+
+        __slots__ = ("bucket_counts", "sum")
+
+        def __init__(self, size: int) -> None:
+            # Per-bucket (non-cumulative) counts; the final slot holds +Inf overflow.
+            self.bucket_counts = array("Q", [0] * size)
+            self.sum = 0.0
+
     class _Histogram:
-        """Minimal histogram implementation emitting Prometheus text format."""
+        """Minimal histogram implementation emitting Prometheus text format.
+
+        Observations are recorded in per-thread shards so the hot path needs no
+        lock; shards are merged per label set when metrics are rendered.
+        """
 
         def __init__(
             self,
@@ -37,7 +53,7 @@ except ModuleNotFoundError:  # pragma: no cover - fallback when dependency is ab
             self.documentation = documentation
             self.labelnames = tuple(labelnames)
             self.buckets = tuple(buckets)
-            self._samples: dict[tuple[str, ...], list[float]] = defaultdict(list)
+            self._shards: dict[tuple[tuple[str, ...], int], _HistogramShard] = {}
             _FALLBACK_REGISTRY.append(self)
 
         def labels(self, **kwargs: str) -> _HistogramChild:
@@ -47,36 +63,59 @@ except ModuleNotFoundError:  # pragma: no cover - fallback when dependency is ab
             return _HistogramChild(self, label_values)
 
         def _observe(self, labels: tuple[str, ...], value: float) -> None:
-            self._samples[labels].append(value)
-
-    def _format_labels(labelnames: tuple[str, ...], values: tuple[str, ...]) -> str:
-        return ",".join(f'{name}="{value}"' for name, value in zip(labelnames, values))
+            key = (labels, threading.get_ident())
+            shard = self._shards.get(key)
+            if shard is None:
+                shard = self._shards[key] = _HistogramShard(len(self.buckets) + 1)
+            shard.bucket_counts[bisect_left(self.buckets, value)] += 1
+            shard.sum += value
+
+        def _collect(self) -> dict[tuple[str, ...], tuple[list[int], float]]:
+            """Merge per-thread shards into bucket counts and sums per label set."""
+
+            merged: dict[tuple[str, ...], tuple[list[int], float]] = {}
+            for (labels, _thread_id), shard in list(self._shards.items()):
+                previous = merged.get(labels)
+                if previous is None:
+                    merged[labels] = (list(shard.bucket_counts), shard.sum)
+                    continue
+                counts, total = previous
+                for index, count in enumerate(shard.bucket_counts):
+                    counts[index] += count
+                merged[labels] = (counts, total + shard.sum)
+            return merged
+
+    def _format_labels(labelnames: tuple[str, ...], values: tuple[str, ...]) -> bytes:
+        return ",".join(
+            f'{name}="{value}"' for name, value in zip(labelnames, values)
+        ).encode()
 
     def generate_latest() -> bytes:
         """Render collected metrics in Prometheus text exposition format."""
 
-        lines: list[str] = []
+        out = bytearray()
         for histogram in _FALLBACK_REGISTRY:
-            lines.append(f"# HELP {histogram.name} {histogram.documentation}")
-            lines.append(f"# TYPE {histogram.name} histogram")
-            for labels, observations in histogram._samples.items():
+            name = histogram.name.encode()
+            bounds = [str(bucket).encode() for bucket in histogram.buckets]
+            out += b"# HELP %s %s\n" % (name, histogram.documentation.encode())
+            out += b"# TYPE %s histogram\n" % name
+            for labels, (bucket_counts, sum_value) in histogram._collect().items():
                 label_str = _format_labels(histogram.labelnames, labels)
-                total = len(observations)
-                for bucket in histogram.buckets:
-                    count = sum(1 for value in observations if value <= bucket)
-                    lines.append(
-                        f"{histogram.name}_bucket{{{label_str},le=\"{bucket}\"}} {count}"
-                    )
-                lines.append(f"{histogram.name}_bucket{{{label_str},le=\"+Inf\"}} {total}")
-                sum_value = sum(observations)
-                lines.append(f"{histogram.name}_sum{{{label_str}}} {sum_value}")
-                lines.append(f"{histogram.name}_count{{{label_str}}} {total}")
-        return "\n".join(lines).encode()
+                cumulative = 0
+                for bound, count in zip(bounds, bucket_counts):
+                    cumulative += count
+                    out += b'%s_bucket{%s,le="%s"} %d\n' % (name, label_str, bound, cumulative)
+                total = cumulative + bucket_counts[-1]
+                out += b'%s_bucket{%s,le="+Inf"} %d\n' % (name, label_str, total)
+                out += b"%s_sum{%s} %s\n" % (name, label_str, str(sum_value).encode())
+                out += b"%s_count{%s} %d\n" % (name, label_str, total)
+        return bytes(out)
 
     Histogram = _Histogram
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
 from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.middleware import UNTRACKED_PATHS
 
 
 REQUEST_LATENCY = Histogram(
@@ -98,54 +137,93 @@ REQUEST_LATENCY = Histogram(
     ),
 )
 
+# Histogram children keyed by (method, path template, status code). Unmatched
+# paths are recorded verbatim, so the cache is capped to bound memory.
+_LABEL_CACHE: dict[tuple[str, str, str], Any] = {}
+_LABEL_CACHE_MAX_SIZE = 1024
+
+# Rendered exposition payload and the monotonic time until which it is served.
+_METRICS_CACHE: tuple[float, bytes] | None = None
+_METRICS_CACHE_TTL_SECONDS = 1.0
+
+
+def _latency_child(method: str, path: str, status_code: str) -> Any:
+    """Return the histogram child for a label combination, memoizing it.
 
-class MetricsMiddleware(BaseHTTPMiddleware):
+    Args:
+        method: HTTP method of the request.
+        path: Route template or raw path of the request.
+        status_code: Response status code rendered as a string.
+
+    Returns:
+        Any: Histogram child exposing ``observe``.
+    """
+    key = (method, path, status_code)
+    child = _LABEL_CACHE.get(key)
+    if child is None:
+        child = REQUEST_LATENCY.labels(method=method, path=path, status_code=status_code)
+        if len(_LABEL_CACHE) < _LABEL_CACHE_MAX_SIZE:
+            _LABEL_CACHE[key] = child
+    return child
+
+
+class MetricsMiddleware:
     """Record request latency metrics for each processed request."""
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap the downstream ASGI application.
+
+        Args:
+            app: ASGI application invoked for each request.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Measure the response time of the wrapped endpoint."""
 
+        if scope["type"] != "http" or scope["path"] in UNTRACKED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = "500"
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = str(message["status"])
+            await send(message)
+
         start_time = time.perf_counter()
         try:
-            response = await call_next(request)
-        except Exception:
+            await self.app(scope, receive, send_wrapper)
+        finally:
             duration = time.perf_counter() - start_time
-            path_template = _resolve_path_template(request)
-            REQUEST_LATENCY.labels(
-                method=request.method,
-                path=path_template,
-                status_code="500",
+            _latency_child(
+                scope["method"], _resolve_path_template(scope), status_code
             ).observe(duration)
-            raise
-        duration = time.perf_counter() - start_time
-        path_template = _resolve_path_template(request)
-        REQUEST_LATENCY.labels(
-            method=request.method,
-            path=path_template,
-            status_code=str(response.status_code),
-        ).observe(duration)
-        return response
 
 
 def render_metrics() -> Response:
-    """Return a Response containing the latest Prometheus metrics."""
+    """Return a Response containing the latest Prometheus metrics.
+
+    The rendered payload is reused for ``_METRICS_CACHE_TTL_SECONDS`` so that
+    back-to-back scrapes do not walk the registry again.
+    """
 
-    payload = generate_latest()
-    return Response(content=payload, media_type=CONTENT_TYPE_LATEST)
+    global _METRICS_CACHE
+    now = time.monotonic()
+    if _METRICS_CACHE is None or _METRICS_CACHE[0] <= now:
+        _METRICS_CACHE = (now + _METRICS_CACHE_TTL_SECONDS, generate_latest())
+    return Response(content=_METRICS_CACHE[1], media_type=CONTENT_TYPE_LATEST)
 
 
-def _resolve_path_template(request: Request) -> str:
-    """Return the Starlette route template associated with the request."""
+def _resolve_path_template(scope: Scope) -> str:
+    """Return the Starlette route template associated with the request scope."""
 
-    scope = request.scope
-    route: Any | None = scope.get("route")
-    if route is None:
+    try:
+        path_template = scope["route"].path
+    except (KeyError, AttributeError):
         return scope.get("path", "unknown")
-    path_template = getattr(route, "path", None)
     if not isinstance(path_template, str):
         return scope.get("path", "unknown")
     return path_template
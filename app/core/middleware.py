@@ -1,67 +1,116 @@
 from __future__ import annotations
 
+import itertools
+import re
+import secrets
 import time
-from typing import Awaitable, Callable
-from uuid import uuid4
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.logging import bind_contextvars, clear_contextvars, get_logger
 
 
 logger = get_logger(name=__name__)
 
+# Request identifiers only need to be unique per process, so a random
+# per-process prefix plus a counter avoids an ``os.urandom`` call per request.
+_REQUEST_ID_PREFIX = secrets.token_hex(4)
+_REQUEST_ID_COUNTER = itertools.count()
+# Caller-supplied IDs are echoed in responses and bound into every log record,
+# so only short values from a conservative character set are trusted.
+_CALLER_REQUEST_ID_PATTERN = re.compile(rb"[A-Za-z0-9._:-]{1,128}")
 
-class RequestContextMiddleware(BaseHTTPMiddleware):
+# Probe and scrape endpoints are excluded from request logging and latency
+# metrics; they are high-frequency and carry no useful per-request signal.
+UNTRACKED_PATHS = frozenset({"/health", "/metrics"})
+
+
+def _resolve_request_id(scope: Scope) -> str:
+    """Return the caller-supplied request ID or generate a new one.
+
+    A supplied ID is only used when it is at most 128 characters of letters,
+    digits, ``.``, ``_``, ``:`` or ``-``; anything else gets a generated ID.
+
+    Args:
+        scope: ASGI connection scope for the incoming request.
+
+    Returns:
+        str: Identifier used to correlate logs and responses.
+    """
+    headers: list[tuple[bytes, bytes]] = scope["headers"]
+    for key, value in headers:
+        if key == b"x-request-id":
+            if _CALLER_REQUEST_ID_PATTERN.fullmatch(value):
+                return value.decode("ascii")
+            break
+    return f"{_REQUEST_ID_PREFIX}-{next(_REQUEST_ID_COUNTER):x}"
+
+
+class RequestContextMiddleware:
     """Attach observability context and request identifiers to responses."""
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
-        """Bind a unique request ID and log request lifecycle events.
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap the downstream ASGI application.
 
         Args:
-            request: Incoming HTTP request object.
-            call_next: Callable that executes the remaining ASGI stack.
+            app: ASGI application invoked for each request.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Bind a unique request ID and log request lifecycle events.
 
-        Returns:
-            Response: Response returned by the downstream application.
+        Args:
+            scope: ASGI connection scope for the incoming request.
+            receive: ASGI callable yielding request messages.
+            send: ASGI callable accepting response messages.
 
         Raises:
             Exception: Propagates any exception raised by the downstream stack.
         """
 
-        request_id = str(uuid4())
+        if scope["type"] != "http" or scope["path"] in UNTRACKED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        request_id = _resolve_request_id(scope)
+        method = scope["method"]
+        path = scope["path"]
         clear_contextvars()
-        bind_contextvars(request_id=request_id, http_method=request.method, http_path=request.url.path)
+        bind_contextvars(request_id=request_id, http_method=method, http_path=path)
+        status_code: int | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"x-request-id", request_id.encode("latin-1")))
+                message["headers"] = headers
+            await send(message)
+
         start_time = time.perf_counter()
-        logger.info("request_started", request_id=request_id, method=request.method, path=request.url.path)
+        logger.info("request_started", request_id=request_id, method=method, path=path)
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_wrapper)
         except Exception:
             duration = time.perf_counter() - start_time
             logger.error(
                 "request_failed",
                 request_id=request_id,
-                method=request.method,
-                path=request.url.path,
+                method=method,
+                path=path,
                 duration=duration,
             )
             clear_contextvars()
             raise
         duration = time.perf_counter() - start_time
-        response.headers["x-request-id"] = request_id
         logger.info(
             "request_completed",
             request_id=request_id,
-            method=request.method,
-            path=request.url.path,
-            status_code=response.status_code,
+            method=method,
+            path=path,
+            status_code=status_code,
             duration=duration,
         )
         clear_contextvars()
-        return response
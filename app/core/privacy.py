@@ -2,6 +2,28 @@ from __future__ import annotations
 
 import hashlib
 
+from app.core.config import get_settings
+
+
+def _hash_key(salt: str) -> bytes:
+    """Derive the BLAKE2b key used to pseudonymize identifiers.
+
+    Args:
+        salt: Configured privacy salt; empty disables keying.
+
+    Returns:
+        bytes: Key of at most 64 bytes, the BLAKE2b limit.
+    """
+    key = salt.encode("utf-8")
+    if len(key) > hashlib.blake2b.MAX_KEY_SIZE:
+        key = hashlib.blake2b(key).digest()
+    return key
+
+
+# Keying the digest turns it into a MAC, so log readers without the salt cannot
+# confirm a guessed email by hashing it themselves.
+_HASH_KEY = _hash_key(get_settings().privacy_salt)
+
 
 def hash_identifier(value: str) -> str:
     """Return a deterministic, truncated digest suitable for logging.
@@ -10,9 +32,8 @@ def hash_identifier(value: str) -> str:
         value: Raw string containing potentially sensitive information.
 
     Returns:
-        str: Lowercase hexadecimal digest truncated to 12 characters.
+        str: Lowercase 12-character hexadecimal digest.
     """
 
     normalized = value.strip().lower().encode("utf-8", errors="ignore")
-    digest = hashlib.sha256(normalized).hexdigest()
-    return digest[:12]
+    return hashlib.blake2b(normalized, digest_size=6, key=_HASH_KEY).hexdigest()
@@ -1,19 +1,120 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
-from typing import Any, cast
+import base64
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any
 
 import bcrypt
-from jose import JWTError, jwt
-from pydantic import ValidationError
+import jwt
+from argon2 import PasswordHasher, Type, extract_parameters
+from argon2.exceptions import InvalidHashError, VerificationError
+from argon2.low_level import ARGON2_VERSION
 
 from app.core.config import get_settings
 from app.models.schemas import TokenPayload
 
 
+_DECODE_OPTIONS = {"require": ["exp", "sub", "token_type"]}
+_TOKEN_TYPES = frozenset({"access", "refresh"})
+_JWT_CONFIG: tuple[str, str] | None = None
+# Signing algorithm, prepared key, and encoded header segment, resolved once.
+_JWT_SIGNER: tuple[Any, Any, bytes] | None = None
+# ``json.dumps`` builds a new encoder whenever non-default options are passed.
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+# Decoded tokens keyed by a 16-byte digest of the raw token, in LRU order.
+_TOKEN_CACHE: OrderedDict[bytes, tuple[float, TokenPayload]] = OrderedDict()
+_TOKEN_CACHE_MAX_SIZE = 10_000
+_TOKEN_CACHE_TTL_SECONDS = 60.0
+
+# Argon2id is the current scheme; bcrypt hashes from earlier releases, and
+# Argon2 hashes made with weaker parameters, are upgraded on the next login.
+_HASH_SETTINGS = get_settings()
+_ARGON2_MEMORY_COST = _HASH_SETTINGS.password_hash_memory_cost
+_ARGON2_MIN_TIME_COST = _HASH_SETTINGS.password_hash_time_cost
+_PASSWORD_HASHER = PasswordHasher(
+    time_cost=_ARGON2_MIN_TIME_COST,
+    memory_cost=_ARGON2_MEMORY_COST,
+    parallelism=1,
+    type=Type.ID,
+)
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+# Hash checked when no account matches a login, built at startup with the
+# current hasher so that branch costs the same as a real verification.
+_DUMMY_PASSWORD_HASH: str | None = None
+
+
+def _jwt_config() -> tuple[str, str]:
+    """Return the JWT signing key and algorithm, resolved once per process.
+
+    Returns:
+        tuple[str, str]: Secret key and signing algorithm from the settings.
+    """
+    global _JWT_CONFIG
+    if _JWT_CONFIG is None:
+        settings = get_settings()
+        _JWT_CONFIG = (settings.secret_key, settings.algorithm)
+    return _JWT_CONFIG
+
+
+def _jwt_signer() -> tuple[Any, Any, bytes]:
+    """Return the objects needed to sign tokens, resolved once per process.
+
+    Preparing the key (which parses PEM material for asymmetric algorithms)
+    and encoding the constant JOSE header are done here instead of on every
+    ``create_token`` call.
+
+    Returns:
+        tuple[Any, Any, bytes]: PyJWT algorithm, prepared signing key, and the
+        base64url-encoded header segment.
+    """
+    global _JWT_SIGNER
+    if _JWT_SIGNER is None:
+        secret_key, algorithm_name = _jwt_config()
+        algorithm = jwt.get_algorithm_by_name(algorithm_name)
+        header = _JSON_ENCODER.encode({"alg": algorithm_name, "typ": "JWT"})
+        _JWT_SIGNER = (algorithm, algorithm.prepare_key(secret_key), _b64url(header.encode()))
+    return _JWT_SIGNER
+
+
+def _b64url(data: bytes) -> bytes:
+    """Encode bytes as unpadded base64url, as used in JWS compact serialization.
+
+    Args:
+        data: Raw bytes to encode.
+
+    Returns:
+        bytes: Encoded segment without ``=`` padding.
+    """
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Check whether a plaintext password matches its hashed counterpart.
 
+    Args:
+        plain_password: Password provided by the user.
+        hashed_password: Stored Argon2id or legacy bcrypt hash to compare against.
+
+    Returns:
+        bool: ``True`` when the password is valid, otherwise ``False``.
+    """
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        return _verify_bcrypt_password(plain_password, hashed_password)
+    try:
+        return _PASSWORD_HASHER.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def _verify_bcrypt_password(plain_password: str, hashed_password: str) -> bool:
+    """Check a password against a legacy bcrypt hash.
+
     Args:
         plain_password: Password provided by the user.
         hashed_password: Stored bcrypt hash to compare against.
@@ -32,24 +133,115 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+def prepare_dummy_password_hash() -> str:
+    """Build the dummy hash with the current hasher if it does not exist yet.
+
+    Called at startup, after any calibration, so the first login for an
+    unknown account does not also pay for hashing and stand out by timing.
+
+    Returns:
+        str: Hash used by ``verify_dummy_password``.
+    """
+    global _DUMMY_PASSWORD_HASH
+    if _DUMMY_PASSWORD_HASH is None:
+        _DUMMY_PASSWORD_HASH = _PASSWORD_HASHER.hash(os.urandom(16).hex())
+    return _DUMMY_PASSWORD_HASH
+
+
+def verify_dummy_password(password: str) -> None:
+    """Run a throwaway verification to equalize timing for unknown accounts.
+
+    Args:
+        password: Password provided by the user.
+    """
+    verify_password(password, prepare_dummy_password_hash())
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Report whether a stored hash is weaker than the current parameters.
+
+    Only weaker costs trigger an upgrade. Workers may calibrate different time
+    costs, and parallelism follows each host's CPU count, so rehashing on any
+    mismatch would make workers rewrite (and sometimes downgrade) each other's
+    hashes on every login.
+
+    Args:
+        hashed_password: Stored password hash.
+
+    Returns:
+        bool: ``True`` for legacy bcrypt hashes, other Argon2 variants or
+        versions, and Argon2id hashes with lower costs or shorter salts/digests.
+    """
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        return True
+    try:
+        stored = extract_parameters(hashed_password)
+    except InvalidHashError:
+        return True
+    current = _PASSWORD_HASHER
+    return (
+        stored.type is not Type.ID
+        or stored.version < ARGON2_VERSION
+        or stored.time_cost < current.time_cost
+        or stored.memory_cost < current.memory_cost
+        or stored.hash_len < current.hash_len
+        or stored.salt_len < current.salt_len
+    )
+
+
 def get_password_hash(password: str) -> str:
-    """Generate a bcrypt hash for the provided password.
+    """Generate an Argon2id hash for the provided password.
 
     Args:
         password: Plaintext password to hash.
 
     Returns:
-        str: Secure bcrypt hash suitable for storage.
+        str: Secure Argon2id hash in PHC string format suitable for storage.
     """
-    password_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password_bytes, salt)
-    return hashed.decode("utf-8")
+    return _PASSWORD_HASHER.hash(password)
+
+
+def calibrate_password_hasher(target_ms: int) -> PasswordHasher:
+    """Tune the Argon2 time cost so hashing takes roughly ``target_ms`` on this host.
+
+    A single ``time_cost=1`` hash is timed and the cost scaled linearly, since
+    Argon2 run time grows proportionally with the number of passes. Existing
+    hashes keep verifying because their parameters are embedded in the PHC
+    string; they are upgraded on the next login via ``password_needs_rehash``.
+
+    Args:
+        target_ms: Desired wall-clock duration of a single hash in milliseconds.
+
+    Returns:
+        PasswordHasher: The hasher now used by ``get_password_hash``.
+    """
+    global _PASSWORD_HASHER, _DUMMY_PASSWORD_HASH
+    parallelism = max(1, (os.cpu_count() or 2) // 2)
+    probe = PasswordHasher(
+        time_cost=1,
+        memory_cost=_ARGON2_MEMORY_COST,
+        parallelism=parallelism,
+        type=Type.ID,
+    )
+    start = time.perf_counter()
+    probe.hash("calibration")
+    elapsed_ms = max((time.perf_counter() - start) * 1000, 1e-3)
+    _PASSWORD_HASHER = PasswordHasher(
+        time_cost=max(_ARGON2_MIN_TIME_COST, round(target_ms / elapsed_ms)),
+        memory_cost=_ARGON2_MEMORY_COST,
+        parallelism=parallelism,
+        type=Type.ID,
+    )
+    _DUMMY_PASSWORD_HASH = None
+    return _PASSWORD_HASHER
 
 
 def create_token(subject: str, expires_delta: timedelta, *, token_type: str) -> str:
     """Create a signed JWT for a given subject.
 
+    The compact token is assembled directly from the cached header segment
+    and prepared key rather than through ``jwt.encode``.
+
     Args:
         subject: Identifier to embed in the token ``sub`` claim.
         expires_delta: Relative expiry window for the token.
@@ -57,15 +249,25 @@ def create_token(subject: str, expires_delta: timedelta, *, token_type: str) ->
     Returns:
         str: Encoded JWT string.
     """
-    settings = get_settings()
-    expire = datetime.now(timezone.utc) + expires_delta
-    payload: dict[str, Any] = {"sub": subject, "exp": expire, "token_type": token_type}
-    return jwt.encode(payload, settings.secret_key, algorithm=settings.algorithm)
+    algorithm, signing_key, header_segment = _jwt_signer()
+    payload: dict[str, Any] = {
+        "sub": subject,
+        "exp": int(time.time() + expires_delta.total_seconds()),
+        "token_type": token_type,
+    }
+    payload_segment = _b64url(_JSON_ENCODER.encode(payload).encode())
+    signing_input = header_segment + b"." + payload_segment
+    signature = algorithm.sign(signing_input, signing_key)
+    return (signing_input + b"." + _b64url(signature)).decode("ascii")
 
 
 def decode_token(token: str, *, expected_type: str | None = None) -> TokenPayload:
     """Decode a JWT and return its payload data.
 
+    Successfully decoded tokens are memoized for up to
+    ``_TOKEN_CACHE_TTL_SECONDS`` (never past their ``exp`` claim), so repeated
+    presentations of the same token skip signature verification.
+
     Args:
         token: Encoded JWT string to validate.
         expected_type: Optional token type that must match the decoded payload.
@@ -76,15 +278,52 @@ def decode_token(token: str, *, expected_type: str | None = None) -> TokenPayloa
     Raises:
         ValueError: If the token is invalid, malformed, or the token type mismatches.
     """
-    settings = get_settings()
-    try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-    except JWTError as exc:  # pragma: no cover - raised for invalid tokens
-        raise ValueError("Invalid token") from exc
-    try:
-        token_payload = cast(TokenPayload, TokenPayload.model_validate(payload))
-    except ValidationError as exc:  # pragma: no cover - schema validation failure
-        raise ValueError("Invalid token payload") from exc
+    cache_key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    now = time.time()
+    cached = _TOKEN_CACHE.get(cache_key)
+    if cached is not None and cached[0] > now:
+        _TOKEN_CACHE.move_to_end(cache_key)
+        token_payload = cached[1]
+    else:
+        _TOKEN_CACHE.pop(cache_key, None)
+        token_payload, expires_at = _decode_token_claims(token)
+        _TOKEN_CACHE[cache_key] = (min(expires_at, now + _TOKEN_CACHE_TTL_SECONDS), token_payload)
+        if len(_TOKEN_CACHE) > _TOKEN_CACHE_MAX_SIZE:
+            _TOKEN_CACHE.popitem(last=False)
     if expected_type is not None and token_payload.token_type != expected_type:
         raise ValueError("Invalid token type")
     return token_payload
+
+
+def _decode_token_claims(token: str) -> tuple[TokenPayload, float]:
+    """Verify a JWT and extract its claims.
+
+    The signature and registered claims are verified by ``jwt.decode``; the
+    custom claims are checked inline rather than through a second Pydantic
+    validation pass, since only tokens signed with our key get this far.
+
+    Args:
+        token: Encoded JWT string to validate.
+
+    Returns:
+        tuple[TokenPayload, float]: Payload data and the token expiry as an epoch timestamp.
+
+    Raises:
+        ValueError: If the token is invalid or its payload is malformed.
+    """
+    secret_key, algorithm = _jwt_config()
+    try:
+        payload = jwt.decode(
+            token,
+            secret_key,
+            algorithms=[algorithm],
+            options=_DECODE_OPTIONS,
+        )
+    except jwt.InvalidTokenError as exc:  # pragma: no cover - raised for invalid tokens
+        raise ValueError("Invalid token") from exc
+    subject = payload.get("sub")
+    token_type = payload.get("token_type")
+    if not isinstance(subject, str) or token_type not in _TOKEN_TYPES:
+        raise ValueError("Invalid token payload")
+    token_payload = TokenPayload.model_construct(sub=subject, token_type=token_type)
+    return token_payload, float(payload["exp"])
@@ -1,29 +1,63 @@
 from __future__ import annotations
 
+import asyncio
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.schema import CreateIndex
 
-from app.core.logging import configure_logging
+from app.core.config import get_settings
+from app.core.deps import get_summarization_service
+from app.core.logging import configure_logging, get_logger
 from app.core.metrics import MetricsMiddleware
 from app.core.middleware import RequestContextMiddleware
+from app.core.security import calibrate_password_hasher, prepare_dummy_password_hash
 from app.models.database import Base, engine
+from app.models.user import EMAIL_LOWER_INDEX
 from app.routers import auth, health, metrics, summary, tasks, users
 
 configure_logging()
+logger = get_logger(name=__name__)
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 app.add_middleware(MetricsMiddleware)
 app.add_middleware(RequestContextMiddleware)
 
 
 @app.on_event("startup")
 async def on_startup() -> None:
-    """Create database tables on application startup.
+    """Create database tables and prepare shared services on application startup.
 
     Returns:
         None: This function is executed for its side effects only.
     """
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(CreateIndex(EMAIL_LOWER_INDEX, if_not_exists=True))
+    except IntegrityError:
+        # Existing rows differ only in email case. Lookups prefer the exact-case
+        # row and resolve other spellings of those addresses to no account until
+        # the duplicates are merged or renamed and the service restarted.
+        logger.warning("email_lower_index_skipped", index=EMAIL_LOWER_INDEX.name)
+    settings = get_settings()
+    if settings.summarization_preload and (settings.openai_api_key or "").strip():
+        # Opt-in: workers that serve /summarize build the client up front so the
+        # first request does not pay for importing the SDK; others skip the RSS.
+        await asyncio.to_thread(get_summarization_service)
+        logger.info("summarization_service_ready")
+    target_ms = settings.password_hash_target_ms
+    if target_ms is not None:
+        hasher = await asyncio.to_thread(calibrate_password_hasher, target_ms)
+        logger.info(
+            "password_hasher_calibrated",
+            target_ms=target_ms,
+            time_cost=hasher.time_cost,
+            parallelism=hasher.parallelism,
+        )
+    await asyncio.to_thread(prepare_dummy_password_hash)
 
 
 app.include_router(health.router)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, TypeAdapter
 
 
 class TokenPair(BaseModel):
@@ -26,10 +26,9 @@ class UserCreate(UserBase):
 
 
 class UserRead(UserBase):
-    id: int
+    model_config = ConfigDict(from_attributes=True)
 
-    class Config:
-        from_attributes = True
+    id: int
 
 
 class UserUpdate(BaseModel):
@@ -58,12 +57,11 @@ class TaskCreate(TaskBase):
 
 
 class TaskRead(TaskBase):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     user_id: int
 
-    class Config:
-        from_attributes = True
-
 
 class TaskUpdate(BaseModel):
     title: str | None = None
@@ -77,3 +75,9 @@ class SummarizeRequest(BaseModel):
 
 class SummarizeResponse(BaseModel):
     summary: str
+
+
+# Adapters validate and dump whole result lists in a single call instead of
+# one model at a time.
+TASK_LIST_ADAPTER: TypeAdapter[list[TaskRead]] = TypeAdapter(list[TaskRead])
+USER_LIST_ADAPTER: TypeAdapter[list[UserRead]] = TypeAdapter(list[UserRead])
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String
+from sqlalchemy import Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.database import Base
@@ -13,6 +13,7 @@ if TYPE_CHECKING:
 
 class User(Base):
     __tablename__ = "users"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255))
@@ -22,6 +23,7 @@ class User(Base):
     tasks: Mapped[list["Task"]] = relationship(
         back_populates="user",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __init__(self, *, name: str, email: str, hashed_password: str) -> None:
@@ -30,8 +32,13 @@ class User(Base):
         Args:
             name: Display name of the user.
             email: Unique email address for the user.
-            hashed_password: Bcrypt hash of the user's password.
+            hashed_password: Argon2id hash of the user's password.
         """
         self.name = name
         self.email = email
         self.hashed_password = hashed_password
+
+
+# Backs case-insensitive email lookups and rejects addresses differing only in case.
+# ``create_all`` only builds it with a new table; startup adds it to older databases.
+EMAIL_LOWER_INDEX = Index("ix_users_email_lower", func.lower(User.email), unique=True)
@@ -10,7 +10,7 @@ router = APIRouter()
 
 
 @router.get("/metrics", include_in_schema=False)
-def get_metrics() -> Response:
+async def get_metrics() -> Response:
     """Expose Prometheus-formatted metrics for scraping."""
 
     return render_metrics()
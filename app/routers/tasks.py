@@ -1,16 +1,22 @@
 from __future__ import annotations
 
-from typing import cast
+from typing import NoReturn
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user_id
 from app.models.database import get_session
-from app.models.schemas import TaskCreate, TaskRead, TaskUpdate
-from app.models.task import Task
-from app.models.user import User
-from app.services.tasks import create_task, delete_task, get_task, list_tasks, update_task
+from app.models.schemas import TASK_LIST_ADAPTER, TaskCreate, TaskRead, TaskUpdate
+from app.services.tasks import (
+    create_task,
+    delete_task_owned,
+    get_task_for_user,
+    list_tasks,
+    task_exists,
+    update_task_owned,
+)
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
@@ -18,62 +24,67 @@ router = APIRouter(prefix="/tasks", tags=["tasks"])
 @router.get("", response_model=list[TaskRead])
 async def read_tasks(
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
-) -> list[TaskRead]:
+    current_user_id: int = Depends(get_current_user_id),
+) -> ORJSONResponse:
     """List tasks that belong to the authenticated user.
 
+    The tasks are already validated by the service, so they are dumped and
+    returned directly instead of being re-validated against ``response_model``.
+
     Args:
         session: Database session dependency.
-        current_user: Authenticated user whose tasks are requested.
+        current_user_id: Identifier of the authenticated user whose tasks are requested.
 
     Returns:
-        list[TaskRead]: Tasks owned by the current user.
+        ORJSONResponse: Tasks owned by the current user.
     """
-    return await list_tasks(session, current_user)
+    tasks = await list_tasks(session, current_user_id)
+    return ORJSONResponse(content=TASK_LIST_ADAPTER.dump_python(tasks))
 
 
 @router.post("", response_model=TaskRead, status_code=status.HTTP_201_CREATED)
 async def create_task_endpoint(
     task_in: TaskCreate,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
-) -> TaskRead:
+    current_user_id: int = Depends(get_current_user_id),
+) -> ORJSONResponse:
     """Create a task for the authenticated user.
 
     Args:
         task_in: Task payload from the request body.
         session: Database session dependency.
-        current_user: Authenticated user creating the task.
+        current_user_id: Identifier of the authenticated user creating the task.
 
     Returns:
-        TaskRead: The created task data.
+        ORJSONResponse: The created task data.
     """
-    return await create_task(session, current_user, task_in)
+    task = await create_task(session, current_user_id, task_in)
+    return ORJSONResponse(content=task.model_dump(), status_code=status.HTTP_201_CREATED)
 
 
 @router.get("/{task_id}", response_model=TaskRead)
 async def read_task(
     task_id: int,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
-) -> TaskRead:
+    current_user_id: int = Depends(get_current_user_id),
+) -> ORJSONResponse:
     """Retrieve a single task if owned by the authenticated user.
 
     Args:
         task_id: Identifier of the task to retrieve.
         session: Database session dependency.
-        current_user: Authenticated user requesting the task.
+        current_user_id: Identifier of the authenticated user requesting the task.
 
     Returns:
-        TaskRead: The requested task data.
+        ORJSONResponse: The requested task data.
 
     Raises:
         HTTPException: Raised when the task is not found or not owned by the user.
     """
-    task: Task | None = await get_task(session, task_id)
-    if task is None or task.user_id != current_user.id:
+    task = await get_task_for_user(session, task_id, current_user_id)
+    if task is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
-    return cast(TaskRead, TaskRead.model_validate(task))
+    return ORJSONResponse(content=task.model_dump())
 
 
 @router.put("/{task_id}", response_model=TaskRead)
@@ -81,28 +92,26 @@ async def update_task_endpoint(
     task_id: int,
     task_in: TaskUpdate,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
-) -> TaskRead:
+    current_user_id: int = Depends(get_current_user_id),
+) -> ORJSONResponse:
     """Update a task owned by the authenticated user.
 
     Args:
         task_id: Identifier of the task to update.
         task_in: Incoming task modifications.
         session: Database session dependency.
-        current_user: Authenticated user attempting the update.
+        current_user_id: Identifier of the authenticated user attempting the update.
 
     Returns:
-        TaskRead: The updated task data.
+        ORJSONResponse: The updated task data.
 
     Raises:
         HTTPException: Raised when the task is missing or not owned by the user.
     """
-    task: Task | None = await get_task(session, task_id)
+    task = await update_task_owned(session, task_id, current_user_id, task_in)
     if task is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
-    if task.user_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
-    return await update_task(session, task, task_in)
+        await _raise_missing_or_forbidden(session, task_id)
+    return ORJSONResponse(content=task.model_dump())
 
 
 @router.delete(
@@ -111,22 +120,34 @@ async def update_task_endpoint(
 async def delete_task_endpoint(
     task_id: int,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user_id: int = Depends(get_current_user_id),
 ) -> Response:
     """Delete a task owned by the authenticated user.
 
     Args:
         task_id: Identifier of the task to delete.
         session: Database session dependency.
-        current_user: Authenticated user attempting the deletion.
+        current_user_id: Identifier of the authenticated user attempting the deletion.
 
     Raises:
         HTTPException: Raised when the task is missing or not owned by the user.
     """
-    task: Task | None = await get_task(session, task_id)
-    if task is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
-    if task.user_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
-    await delete_task(session, task)
+    if not await delete_task_owned(session, task_id, current_user_id):
+        await _raise_missing_or_forbidden(session, task_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+async def _raise_missing_or_forbidden(session: AsyncSession, task_id: int) -> NoReturn:
+    """Raise the error for a task the current user could not modify.
+
+    Args:
+        session: Database session dependency.
+        task_id: Identifier of the task that was not modified.
+
+    Raises:
+        HTTPException: 403 when the task exists but belongs to another user,
+            otherwise 404.
+    """
+    if await task_exists(session, task_id):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
+    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
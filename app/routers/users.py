@@ -1,14 +1,12 @@
 from __future__ import annotations
 
-from typing import cast
-
 from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user_id
 from app.models.database import get_session
-from app.models.schemas import UserCreate, UserRead, UserUpdate
-from app.models.user import User
+from app.models.schemas import USER_LIST_ADAPTER, UserCreate, UserRead, UserUpdate
 from app.services.users import create_user, delete_user, get_user, list_users, update_user
 
 router = APIRouter(prefix="/users", tags=["users"])
@@ -17,25 +15,29 @@ router = APIRouter(prefix="/users", tags=["users"])
 @router.get("", response_model=list[UserRead])
 async def read_users(
     session: AsyncSession = Depends(get_session),
-    _: User = Depends(get_current_user),
-) -> list[UserRead]:
+    _: int = Depends(get_current_user_id),
+) -> ORJSONResponse:
     """List all users in the system.
 
+    The users are already validated by the service, so they are dumped and
+    returned directly instead of being re-validated against ``response_model``.
+
     Args:
         session: Database session dependency.
         _: Authenticated user dependency (unused).
 
     Returns:
-        list[UserRead]: Collection of persisted users.
+        ORJSONResponse: Collection of persisted users.
     """
-    return await list_users(session)
+    users = await list_users(session)
+    return ORJSONResponse(content=USER_LIST_ADAPTER.dump_python(users))
 
 
 @router.post("", response_model=UserRead, status_code=status.HTTP_201_CREATED)
 async def create_user_endpoint(
     user_in: UserCreate,
     session: AsyncSession = Depends(get_session),
-    _: User = Depends(get_current_user),
+    _: int = Depends(get_current_user_id),
 ) -> UserRead:
     """Create a new user record.
 
@@ -60,7 +62,7 @@ async def create_user_endpoint(
 async def read_user(
     user_id: int,
     session: AsyncSession = Depends(get_session),
-    _: User = Depends(get_current_user),
+    _: int = Depends(get_current_user_id),
 ) -> UserRead:
     """Retrieve a single user by identifier.
 
@@ -78,7 +80,7 @@ async def read_user(
     user = await get_user(session, user_id)
     if user is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-    return cast(UserRead, UserRead.model_validate(user))
+    return UserRead.model_validate(user)
 
 
 @router.put("/{user_id}", response_model=UserRead)
@@ -86,7 +88,7 @@ async def update_user_endpoint(
     user_id: int,
     user_in: UserUpdate,
     session: AsyncSession = Depends(get_session),
-    _: User = Depends(get_current_user),
+    _: int = Depends(get_current_user_id),
 ) -> UserRead:
     """Update an existing user record.
 
@@ -117,7 +119,7 @@ async def update_user_endpoint(
 async def delete_user_endpoint(
     user_id: int,
     session: AsyncSession = Depends(get_session),
-    _: User = Depends(get_current_user),
+    _: int = Depends(get_current_user_id),
 ) -> Response:
     """Remove a user from the database.
 
@@ -129,9 +131,7 @@ async def delete_user_endpoint(
     Raises:
         HTTPException: Raised when the user does not exist.
     """
-    user = await get_user(session, user_id)
-    if user is None:
+    if not await delete_user(session, user_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-    await delete_user(session, user)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
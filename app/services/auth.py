@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -7,7 +8,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.core.privacy import hash_identifier
-from app.core.security import create_token, verify_password
+from app.core.security import (
+    create_token,
+    get_password_hash,
+    password_needs_rehash,
+    verify_dummy_password,
+    verify_password,
+)
 from app.models.schemas import TokenPair
 from app.models.user import User
 from app.services.users import get_user_by_email
@@ -15,6 +22,10 @@ from app.services.users import get_user_by_email
 
 logger = get_logger(name=__name__)
 
+_SETTINGS = get_settings()
+_ACCESS_TOKEN_TTL = timedelta(minutes=_SETTINGS.access_token_expire_minutes)
+_REFRESH_TOKEN_TTL = timedelta(minutes=_SETTINGS.refresh_token_expire_minutes)
+
 
 async def authenticate_user(session: AsyncSession, email: str, password: str) -> User:
     """Validate user credentials and return the matching user.
@@ -32,13 +43,19 @@ async def authenticate_user(session: AsyncSession, email: str, password: str) ->
     """
     user = await get_user_by_email(session, email)
     if user is None:
+        # Hash anyway so unknown emails cannot be told apart by response time.
+        await asyncio.to_thread(verify_dummy_password, password)
         logger.warning("authenticate_user_missing", email_hash=hash_identifier(email))
         raise ValueError("Invalid credentials")
-    if not verify_password(password, user.hashed_password):
+    if not await asyncio.to_thread(verify_password, password, user.hashed_password):
         logger.warning(
             "authenticate_user_invalid_password", email_hash=hash_identifier(email)
         )
         raise ValueError("Invalid credentials")
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = await asyncio.to_thread(get_password_hash, password)
+        await session.commit()
+        logger.info("authenticate_user_rehashed", user_id=user.id)
     logger.info(
         "authenticate_user_success", user_id=user.id, email_hash=hash_identifier(email)
     )
@@ -54,15 +71,14 @@ async def create_token_pair(user: User) -> TokenPair:
     Returns:
         TokenPair: Newly generated access and refresh tokens.
     """
-    settings = get_settings()
     access_token = create_token(
         subject=user.email,
-        expires_delta=timedelta(minutes=settings.access_token_expire_minutes),
+        expires_delta=_ACCESS_TOKEN_TTL,
         token_type="access",
     )
     refresh_token = create_token(
         subject=user.email,
-        expires_delta=timedelta(minutes=settings.refresh_token_expire_minutes),
+        expires_delta=_REFRESH_TOKEN_TTL,
         token_type="refresh",
     )
     logger.info("create_token_pair", user_id=user.id, email_hash=hash_identifier(user.email))
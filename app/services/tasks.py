@@ -1,57 +1,83 @@
 from __future__ import annotations
 
-from typing import cast
-
-from sqlalchemy import select
+from sqlalchemy import bindparam, delete, exists, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
-from app.models.schemas import TaskCreate, TaskRead, TaskUpdate
+from app.models.schemas import TASK_LIST_ADAPTER, TaskCreate, TaskRead, TaskUpdate
 from app.models.task import Task
-from app.models.user import User
 
 
 logger = get_logger(name=__name__)
 
+_TASK_STREAM_BATCH_SIZE = 200
+_TASK_COLUMNS = (Task.id, Task.title, Task.description, Task.completed, Task.user_id)
+
+# Read statements are built once with bound parameters and reused per call.
+_LIST_TASKS_STATEMENT = (
+    select(Task)
+    .where(Task.user_id == bindparam("user_id"))
+    .execution_options(yield_per=_TASK_STREAM_BATCH_SIZE)
+)
+_TASK_FOR_USER_STATEMENT = select(*_TASK_COLUMNS).where(
+    Task.id == bindparam("task_id"), Task.user_id == bindparam("user_id")
+)
+
 
-async def list_tasks(session: AsyncSession, user: User) -> list[TaskRead]:
+async def list_tasks(session: AsyncSession, user_id: int) -> list[TaskRead]:
     """Return tasks for the specified user.
 
+    Rows are streamed in batches so only one batch of ORM instances is alive
+    at a time while the serialized list is built.
+
     Args:
         session: Database session used for retrieval.
-        user: Owner of the tasks to query.
+        user_id: Identifier of the owner of the tasks to query.
 
     Returns:
         list[TaskRead]: Serialized tasks belonging to the user.
     """
-    result = await session.scalars(select(Task).where(Task.user_id == user.id))
-    tasks = result.all()
-    serialized = [cast(TaskRead, TaskRead.model_validate(task)) for task in tasks]
-    logger.info("list_tasks", user_id=user.id, task_count=len(serialized))
+    result = await session.stream_scalars(_LIST_TASKS_STATEMENT, {"user_id": user_id})
+    serialized: list[TaskRead] = []
+    async for partition in result.partitions():
+        serialized.extend(TASK_LIST_ADAPTER.validate_python(partition, from_attributes=True))
+    logger.info("list_tasks", user_id=user_id, task_count=len(serialized))
     return serialized
 
 
-async def get_task(session: AsyncSession, task_id: int) -> Task | None:
-    """Fetch a task by identifier.
+async def get_task_for_user(
+    session: AsyncSession, task_id: int, user_id: int
+) -> TaskRead | None:
+    """Fetch a task owned by the given user for read-only use.
+
+    Ownership is part of the ``WHERE`` clause, so tasks belonging to other
+    users are never loaded. Plain columns are selected instead of an ORM
+    instance, avoiding identity-map bookkeeping on the read path.
 
     Args:
         session: Database session used for retrieval.
         task_id: Primary key of the task.
+        user_id: Identifier of the user that must own the task.
 
     Returns:
-        Task | None: The matching task or ``None`` if absent.
+        TaskRead | None: Serialized task or ``None`` if absent or not owned by the user.
     """
-    task = await session.get(Task, task_id)
-    logger.info("get_task", task_id=task_id, found=task is not None)
-    return cast(Task | None, task)
+    result = await session.execute(
+        _TASK_FOR_USER_STATEMENT, {"task_id": task_id, "user_id": user_id}
+    )
+    row = result.mappings().first()
+    logger.info("get_task", task_id=task_id, found=row is not None)
+    if row is None:
+        return None
+    return TaskRead.model_validate(row)
 
 
-async def create_task(session: AsyncSession, user: User, task_in: TaskCreate) -> TaskRead:
+async def create_task(session: AsyncSession, user_id: int, task_in: TaskCreate) -> TaskRead:
     """Create and persist a new task for a user.
 
     Args:
         session: Database session used for persistence.
-        user: Owner of the new task.
+        user_id: Identifier of the owner of the new task.
         task_in: Data describing the task.
 
     Returns:
@@ -61,45 +87,78 @@ async def create_task(session: AsyncSession, user: User, task_in: TaskCreate) ->
         title=task_in.title,
         description=task_in.description,
         completed=task_in.completed,
-        user_id=user.id,
+        user_id=user_id,
     )
     session.add(task)
     await session.commit()
-    await session.refresh(task)
-    logger.info("create_task_success", task_id=task.id, user_id=user.id)
-    return cast(TaskRead, TaskRead.model_validate(task))
+    logger.info("create_task_success", task_id=task.id, user_id=user_id)
+    return TaskRead.model_validate(task)
+
+
+async def task_exists(session: AsyncSession, task_id: int) -> bool:
+    """Check whether a task exists regardless of its owner.
+
+    Args:
+        session: Database session used for retrieval.
+        task_id: Primary key of the task.
 
+    Returns:
+        bool: ``True`` when a task with the identifier exists.
+    """
+    return bool(await session.scalar(select(exists().where(Task.id == task_id))))
 
-async def update_task(session: AsyncSession, task: Task, task_in: TaskUpdate) -> TaskRead:
-    """Apply updates to an existing task.
+
+async def update_task_owned(
+    session: AsyncSession, task_id: int, user_id: int, task_in: TaskUpdate
+) -> TaskRead | None:
+    """Apply updates to a task owned by the given user in a single statement.
 
     Args:
         session: Database session used for persistence.
-        task: Task instance to update.
+        task_id: Primary key of the task to update.
+        user_id: Identifier of the user that must own the task.
         task_in: Requested updates for the task.
 
     Returns:
-        TaskRead: Serialized representation of the updated task.
+        TaskRead | None: Serialized updated task, or ``None`` when no task with
+        the identifier is owned by the user.
     """
-    if task_in.title is not None:
-        task.title = task_in.title
-    if task_in.description is not None:
-        task.description = task_in.description
-    if task_in.completed is not None:
-        task.completed = task_in.completed
+    # Only fields present in the request are written; an explicit ``null`` is
+    # treated as "no change", matching the previous per-field behaviour.
+    changes = task_in.model_dump(exclude_unset=True, exclude_none=True)
+    if not changes:
+        return await get_task_for_user(session, task_id, user_id)
+    statement = (
+        update(Task)
+        .where(Task.id == task_id, Task.user_id == user_id)
+        .values(**changes)
+        .returning(*_TASK_COLUMNS)
+    )
+    result = await session.execute(statement)
+    row = result.mappings().first()
     await session.commit()
-    await session.refresh(task)
-    logger.info("update_task_success", task_id=task.id)
-    return cast(TaskRead, TaskRead.model_validate(task))
+    if row is None:
+        return None
+    logger.info("update_task_success", task_id=task_id)
+    return TaskRead.model_validate(row)
 
 
-async def delete_task(session: AsyncSession, task: Task) -> None:
-    """Delete a task from the database.
+async def delete_task_owned(session: AsyncSession, task_id: int, user_id: int) -> bool:
+    """Delete a task owned by the given user in a single statement.
 
     Args:
         session: Database session used for persistence.
-        task: Task instance to remove.
+        task_id: Primary key of the task to remove.
+        user_id: Identifier of the user that must own the task.
+
+    Returns:
+        bool: ``True`` when the task was deleted, ``False`` when no task with
+        the identifier is owned by the user.
     """
-    await session.delete(task)
+    statement = delete(Task).where(Task.id == task_id, Task.user_id == user_id).returning(Task.id)
+    result = await session.execute(statement)
+    deleted = result.scalar_one_or_none() is not None
     await session.commit()
-    logger.info("delete_task_success", task_id=task.id)
+    if deleted:
+        logger.info("delete_task_success", task_id=task_id)
+    return deleted
@@ -1,33 +1,53 @@
 from __future__ import annotations
 
-from typing import cast
+import asyncio
+from typing import TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, delete, func, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
 from app.core.privacy import hash_identifier
 from app.core.security import get_password_hash
-from app.models.schemas import UserCreate, UserRead, UserUpdate
+from app.models.schemas import USER_LIST_ADAPTER, UserCreate, UserRead, UserUpdate
 from app.models.user import User
 
 
 logger = get_logger(name=__name__)
 
+_T = TypeVar("_T")
+
+# Lookup statements are built once with bound parameters and reused per call.
+# Emails match case-insensitively through the ``lower(email)`` index. Both sides
+# are lowered in SQL, since the database's ``lower()`` may fold fewer characters
+# than ``str.lower`` (SQLite only folds ASCII). Databases that predate the index
+# can hold addresses differing only in case, so every match is fetched and
+# resolved by ``_resolve_email_match``.
+_USER_BY_EMAIL_STATEMENT = select(User).where(
+    func.lower(User.email) == func.lower(bindparam("email"))
+)
+_USER_ID_BY_EMAIL_STATEMENT = select(User.id, User.email).where(
+    func.lower(User.email) == func.lower(bindparam("email"))
+)
+
+_LIST_USERS_STATEMENT = select(User.id, User.name, User.email)
+
 
 async def list_users(session: AsyncSession) -> list[UserRead]:
     """Return all users from the database.
 
+    Only the public columns are selected, so password hashes are never loaded
+    and no ORM instances are built for the identity map.
+
     Args:
         session: Database session used for retrieval.
 
     Returns:
         list[UserRead]: Serialized user models.
     """
-    result = await session.scalars(select(User))
-    users = result.all()
-    serialized = [cast(UserRead, UserRead.model_validate(user)) for user in users]
+    result = await session.execute(_LIST_USERS_STATEMENT)
+    serialized = USER_LIST_ADAPTER.validate_python(result.mappings().all())
     logger.info("list_users", user_count=len(serialized))
     return serialized
 
@@ -42,29 +62,75 @@ async def get_user(session: AsyncSession, user_id: int) -> User | None:
     Returns:
         User | None: The matching user or ``None`` if absent.
     """
-    user = await session.get(User, user_id)
+    user: User | None = await session.get(User, user_id)
     logger.info("get_user", user_id=user_id, found=user is not None)
-    return cast(User | None, user)
+    return user
+
+
+def _resolve_email_match(matches: list[tuple[str, _T]], email: str) -> _T | None:
+    """Pick the account a case-insensitive email lookup refers to.
+
+    An exact-case match always wins. Otherwise the lookup resolves only when a
+    single account matches; several case variants that all differ from the
+    requested address are ambiguous and resolve to no account.
+
+    Args:
+        matches: Stored email and value for each row that matched.
+        email: Email address that was searched.
+
+    Returns:
+        _T | None: Value for the resolved account, or ``None`` if absent or ambiguous.
+    """
+    for stored, value in matches:
+        if stored == email:
+            return value
+    if len(matches) == 1:
+        return matches[0][1]
+    if matches:
+        logger.warning(
+            "email_lookup_ambiguous",
+            email_hash=hash_identifier(email),
+            match_count=len(matches),
+        )
+    return None
 
 
 async def get_user_by_email(session: AsyncSession, email: str) -> User | None:
-    """Fetch a user by email address.
+    """Fetch a user by email address, ignoring case.
 
     Args:
         session: Database session used for retrieval.
         email: Email address to search.
 
     Returns:
-        User | None: The matching user or ``None`` if absent.
+        User | None: The matching user, or ``None`` if absent or ambiguous.
     """
-    result = await session.execute(select(User).where(User.email == email))
-    user = result.scalar_one_or_none()
+    users: list[User] = (await session.scalars(_USER_BY_EMAIL_STATEMENT, {"email": email})).all()
+    user = _resolve_email_match([(user.email, user) for user in users], email)
     logger.info(
         "get_user_by_email",
         email_hash=hash_identifier(email),
         found=user is not None,
     )
-    return cast(User | None, user)
+    return user
+
+
+async def get_user_id_by_email(session: AsyncSession, email: str) -> int | None:
+    """Resolve a user's identifier from their email address, ignoring case.
+
+    Only the id and email columns are selected. The result is deliberately not cached:
+    deletes and email changes in one worker would not reach the others, and a
+    stale id could authenticate a token as an account that no longer owns it.
+
+    Args:
+        session: Database session used for retrieval.
+        email: Email address to search.
+
+    Returns:
+        int | None: Identifier of the matching user, or ``None`` if absent or ambiguous.
+    """
+    result = await session.execute(_USER_ID_BY_EMAIL_STATEMENT, {"email": email})
+    return _resolve_email_match([(stored, user_id) for user_id, stored in result.all()], email)
 
 
 async def create_user(session: AsyncSession, user_in: UserCreate) -> UserRead:
@@ -80,22 +146,18 @@ async def create_user(session: AsyncSession, user_in: UserCreate) -> UserRead:
     Raises:
         ValueError: If the email already exists.
     """
-    hashed_password = get_password_hash(user_in.password)
+    email_hash = hash_identifier(user_in.email)
+    hashed_password = await asyncio.to_thread(get_password_hash, user_in.password)
     user = User(name=user_in.name, email=user_in.email, hashed_password=hashed_password)
     session.add(user)
     try:
         await session.commit()
     except IntegrityError as exc:
         await session.rollback()
-        logger.warning(
-            "create_user_conflict", email_hash=hash_identifier(user_in.email)
-        )
+        logger.warning("create_user_conflict", email_hash=email_hash)
         raise ValueError("Email already registered") from exc
-    await session.refresh(user)
-    logger.info(
-        "create_user_success", user_id=user.id, email_hash=hash_identifier(user.email)
-    )
-    return cast(UserRead, UserRead.model_validate(user))
+    logger.info("create_user_success", user_id=user.id, email_hash=email_hash)
+    return UserRead.model_validate(user)
 
 
 async def update_user(session: AsyncSession, user: User, user_in: UserUpdate) -> UserRead:
@@ -112,37 +174,46 @@ async def update_user(session: AsyncSession, user: User, user_in: UserUpdate) ->
     Raises:
         ValueError: If the new email conflicts with an existing account.
     """
-    if user_in.name is not None:
-        user.name = user_in.name
-    if user_in.email is not None:
-        user.email = user_in.email
-    if user_in.password is not None:
-        user.hashed_password = get_password_hash(user_in.password)
+    changes = user_in.model_dump(exclude_unset=True, exclude_none=True)
+    if "password" in changes:
+        changes["hashed_password"] = await asyncio.to_thread(
+            get_password_hash, changes.pop("password")
+        )
+    for field, value in changes.items():
+        setattr(user, field, value)
+    # Both outcomes log the address the user was being given; hash it once up
+    # front, since a rollback expires the instance attributes.
+    user_id = user.id
+    email_hash = hash_identifier(user.email)
     try:
         await session.commit()
     except IntegrityError as exc:
         await session.rollback()
-        logger.warning(
-            "update_user_conflict",
-            user_id=user.id,
-            email_hash=hash_identifier(user_in.email or user.email),
-        )
+        logger.warning("update_user_conflict", user_id=user_id, email_hash=email_hash)
         raise ValueError("Email already registered") from exc
-    await session.refresh(user)
-    logger.info(
-        "update_user_success", user_id=user.id, email_hash=hash_identifier(user.email)
-    )
-    return cast(UserRead, UserRead.model_validate(user))
+    logger.info("update_user_success", user_id=user_id, email_hash=email_hash)
+    return UserRead.model_validate(user)
+
 
+async def delete_user(session: AsyncSession, user_id: int) -> bool:
+    """Delete a user and, through ``ON DELETE CASCADE``, their tasks.
 
-async def delete_user(session: AsyncSession, user: User) -> None:
-    """Delete a user from the database.
+    A single ``DELETE ... RETURNING`` statement is issued; the database removes
+    dependent rows, so no related objects are loaded into the session.
 
     Args:
         session: Database session used for persistence.
-        user: User instance to remove.
+        user_id: Identifier of the user to remove.
+
+    Returns:
+        bool: ``True`` when the user existed and was deleted.
     """
-    await session.delete(user)
+    result = await session.execute(
+        delete(User).where(User.id == user_id).returning(User.id)
+    )
+    deleted_id: int | None = result.scalar_one_or_none()
     await session.commit()
-    logger.info("delete_user_success", user_id=user.id)
-
+    if deleted_id is None:
+        return False
+    logger.info("delete_user_success", user_id=user_id)
+    return True
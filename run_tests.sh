@@ -1,4 +1,4 @@
 #!/usr/bin/env bash
 set -euo pipefail
 
-PYTHONPATH="${PYTHONPATH:-.}" pytest --cov=app --cov-report=term-missing "$@"
+PYTHONPATH="${PYTHONPATH:-.}" pytest -n auto --dist=loadfile --cov=app --cov-report=term-missing "$@"
@@ -1,6 +1,6 @@
 _Salt = bytes
 _Hash = bytes
 
-def gensalt() -> _Salt: ...
+def gensalt(rounds: int = ..., prefix: bytes = ...) -> _Salt: ...
 def hashpw(password: bytes, salt: _Salt) -> _Hash: ...
 def checkpw(password: bytes, hashed_password: bytes) -> bool: ...
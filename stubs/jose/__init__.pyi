@@ -1,4 +0,0 @@
-from .exceptions import JWTError
-from . import jwt
-
-__all__ = ["JWTError", "jwt"]
@@ -1,2 +0,0 @@
-class JWTError(Exception):
-    ...
@@ -1,4 +0,0 @@
-from typing import Any
-
-def encode(claims: dict[str, Any], key: str, algorithm: str) -> str: ...
-def decode(token: str, key: str, algorithms: list[str]) -> dict[str, Any]: ...
@@ -1,4 +1,4 @@
-from typing import Any, ClassVar, Generic, TypeVar
+from typing import Any, ClassVar, Generic, Self, TypeVar
 
 _T = TypeVar("_T")
 
@@ -7,7 +7,16 @@ class BaseModel:
     def __init__(self, **data: Any) -> None: ...
     def model_dump(self, *args: Any, **kwargs: Any) -> dict[str, Any]: ...
     @classmethod
-    def model_validate(cls, obj: Any) -> Any: ...
+    def model_validate(cls, obj: Any) -> Self: ...
+    @classmethod
+    def model_construct(cls, **values: Any) -> Self: ...
+
+def ConfigDict(**kwargs: Any) -> dict[str, Any]: ...
+
+class TypeAdapter(Generic[_T]):
+    def __init__(self, type: Any, **kwargs: Any) -> None: ...
+    def validate_python(self, obj: Any, /, *, from_attributes: bool | None = ..., **kwargs: Any) -> _T: ...
+    def dump_python(self, instance: _T, /, **kwargs: Any) -> Any: ...
 
 class EmailStr(str):
     ...
@@ -12,4 +12,21 @@ class Text:
 class ForeignKey:
     def __init__(self, target: str, *args: Any, **kwargs: Any) -> None: ...
 
+class Index:
+    name: str
+    def __init__(self, name: str, *expressions: Any, **kwargs: Any) -> None: ...
+
+func: Any
+
 def select(*entities: Any, **kwargs: Any) -> Any: ...
+def update(table: Any) -> Any: ...
+def delete(table: Any) -> Any: ...
+def exists(*args: Any) -> Any: ...
+def bindparam(key: str, *args: Any, **kwargs: Any) -> Any: ...
+
+def make_url(name_or_url: Any) -> Any: ...
+
+class _Event:
+    def listen(self, target: Any, identifier: str, fn: Any, *args: Any, **kwargs: Any) -> None: ...
+
+event: _Event
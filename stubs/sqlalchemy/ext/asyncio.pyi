@@ -4,7 +4,9 @@ class AsyncSession:
     async def __aenter__(self) -> "AsyncSession": ...
     async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None: ...
     async def execute(self, statement: Any, *args: Any, **kwargs: Any) -> Any: ...
+    async def scalar(self, statement: Any, *args: Any, **kwargs: Any) -> Any: ...
     async def scalars(self, statement: Any, *args: Any, **kwargs: Any) -> Any: ...
+    async def stream_scalars(self, statement: Any, *args: Any, **kwargs: Any) -> Any: ...
     async def commit(self) -> None: ...
     async def rollback(self) -> None: ...
     async def refresh(self, instance: Any) -> None: ...
@@ -12,6 +14,12 @@ class AsyncSession:
     async def delete(self, instance: Any) -> None: ...
     def add(self, instance: Any) -> None: ...
 
+class AsyncEngine:
+    sync_engine: Any
+    dialect: Any
+    def begin(self) -> Any: ...
+    async def dispose(self) -> None: ...
+
 class _SessionFactory(Protocol):
     def __call__(self, *args: Any, **kwargs: Any) -> AsyncSession: ...
 
@@ -21,4 +29,4 @@ class _SessionFactory(Protocol):
 
 def async_sessionmaker(*args: Any, **kwargs: Any) -> _SessionFactory: ...
 
-def create_async_engine(url: str, *args: Any, **kwargs: Any) -> Any: ...
+def create_async_engine(url: str, *args: Any, **kwargs: Any) -> AsyncEngine: ...
@@ -0,0 +1,4 @@
+from typing import Any
+
+class CreateIndex:
+    def __init__(self, element: Any, if_not_exists: bool = ...) -> None: ...
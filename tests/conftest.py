@@ -1,20 +1,96 @@
 from __future__ import annotations
 
+import ast
 import asyncio
-import json
-from collections.abc import AsyncGenerator
+import os
+import shutil
+from collections import Counter
+from collections.abc import AsyncGenerator, Generator
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 from urllib.parse import urlsplit
 
+import orjson
 import pytest
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+# Hashing costs are read when ``app.core.security`` is imported, so the cheap
+# test parameters must be in the environment before the application is.
+os.environ.setdefault("PASSWORD_HASH_TIME_COST", "1")
+os.environ.setdefault("PASSWORD_HASH_MEMORY_COST", "1024")
+
+from app import main as main_module  # noqa: E402
+from app.core.deps import get_summarization_service  # noqa: E402
+from app.core import security  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.database import build_engine, get_session  # noqa: E402
+from app.models.schemas import UserCreate, UserRead  # noqa: E402
+from app.services import auth as auth_service  # noqa: E402
+from app.services import users as users_service  # noqa: E402
+
+
+# Scope fields that are identical for every request issued by the test client.
+_BASE_SCOPE = MappingProxyType(
+    {
+        "type": "http",
+        "http_version": "1.1",
+        "asgi": {"version": "3.0"},
+        "scheme": "http",
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+)
+
+
+@lru_cache(maxsize=256)
+def _encode_header(value: str) -> bytes:
+    """Encode a header name or value, memoizing the repeated ones.
+
+    Args:
+        value: Header name or value to encode.
+
+    Returns:
+        bytes: Encoded header component.
+    """
+    return value.encode()
+
+
+@lru_cache(maxsize=256)
+def _memoized_password_hash(password: str) -> str:
+    """Hash a password once per test session.
+
+    Argon2 dominates the run time of HTTP-level tests, which sign up and log in
+    with the same few passwords; the hashing itself is covered by
+    ``test_security.py`` against the real functions.
+
+    Args:
+        password: Plaintext password to hash.
+
+    Returns:
+        str: Hash produced by ``security.get_password_hash``.
+    """
+    return security.get_password_hash(password)
+
 
-from app import main as main_module
-from app.core.deps import get_summarization_service
-from app.main import app
-from app.models.database import Base, get_session
+@lru_cache(maxsize=256)
+def _memoized_verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against a hash once per test session.
+
+    Args:
+        plain_password: Password provided by the user.
+        hashed_password: Stored hash to compare against.
+
+    Returns:
+        bool: Result of ``security.verify_password``.
+    """
+    return security.verify_password(plain_password, hashed_password)
+
+
+# Marks a response whose body has not been parsed yet; ``None`` is a valid result.
+_UNPARSED = object()
 
 
 class SimpleResponse:
@@ -31,24 +107,28 @@ class SimpleResponse:
         self.status_code = status_code
         self.headers = headers
         self._body = body
+        self._json: Any = _UNPARSED
+        self._text: str | None = None
 
     def json(self) -> Any:
-        """Return the response payload parsed as JSON.
+        """Return the response payload parsed as JSON, parsing it at most once.
 
         Returns:
             Any: Parsed JSON content or ``None`` if the body is empty.
         """
-        if not self._body:
-            return None
-        return json.loads(self._body.decode())
+        if self._json is _UNPARSED:
+            self._json = orjson.loads(self._body) if self._body else None
+        return self._json
 
     def text(self) -> str:
-        """Return the response body decoded as UTF-8 text.
+        """Return the response body decoded as UTF-8 text, decoding it at most once.
 
         Returns:
             str: Decoded response body.
         """
-        return self._body.decode()
+        if self._text is None:
+            self._text = self._body.decode()
+        return self._text
 
 
 class SimpleAsyncClient:
@@ -87,38 +167,38 @@ class SimpleAsyncClient:
 
         header_items: list[tuple[bytes, bytes]] = []
         if headers is not None:
-            header_items.extend((key.lower().encode(), value.encode()) for key, value in headers.items())
+            header_items.extend(
+                (_encode_header(key.lower()), _encode_header(value)) for key, value in headers.items()
+            )
 
         body = b""
         if json_body is not None:
-            body = json.dumps(json_body).encode()
+            body = orjson.dumps(json_body)
             header_items.append((b"content-type", b"application/json"))
             header_items.append((b"content-length", str(len(body)).encode()))
 
         scope = {
-            "type": "http",
-            "http_version": "1.1",
-            "asgi": {"version": "3.0"},
+            **_BASE_SCOPE,
             "method": method.upper(),
-            "scheme": "http",
             "path": path,
             "raw_path": path.encode(),
             "query_string": query_string,
             "headers": header_items,
-            "client": ("testclient", 50000),
-            "server": ("testserver", 80),
         }
 
-        receive_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
-        await receive_queue.put({"type": "http.request", "body": body, "more_body": False})
+        request_sent = False
 
         async def receive() -> dict[str, Any]:
-            """Return the next ASGI receive message from the queue.
+            """Return the request body once, then report a disconnect.
 
             Returns:
-                dict[str, Any]: Message consumed from the queue.
+                dict[str, Any]: Next ASGI receive message.
             """
-            return await receive_queue.get()
+            nonlocal request_sent
+            if request_sent:
+                return {"type": "http.disconnect"}
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
 
         response_start: dict[str, Any] | None = None
         body_parts: list[bytes] = []
@@ -205,22 +285,136 @@ class SimpleAsyncClient:
         return await self._request("DELETE", url, headers=headers)
 
 
+class _FakeSummarizationService:
+    """Deterministic summarization stub for tests."""
+
+    async def summarize(self, text: str) -> str:
+        """Return a reproducible summary for the provided text."""
+
+        stripped = text.strip()
+        if not stripped:
+            raise ValueError("Text must not be empty")
+        return f"summary:{len(stripped)}"
+
+
+# The application is built once on import; the client and the stateless stub
+# only hold references, so every test shares them and swaps dependency overrides.
+_FAKE_SUMMARIZATION_SERVICE = _FakeSummarizationService()
+_CLIENT = SimpleAsyncClient(app)
+
+
+def _duplicate_test_names(path: Path) -> list[str]:
+    """Return test names defined more than once in the same scope of a module.
+
+    A redefined function silently replaces the earlier one, so pytest never
+    sees the duplicate; the source has to be inspected instead.
+
+    Args:
+        path: Test module to inspect.
+
+    Returns:
+        list[str]: Qualified names (``Class.test`` for methods) defined repeatedly.
+    """
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    scopes: list[tuple[str, list[ast.stmt]]] = [("", tree.body)]
+    scopes.extend(
+        (f"{node.name}.", node.body) for node in tree.body if isinstance(node, ast.ClassDef)
+    )
+    duplicates: list[str] = []
+    for prefix, body in scopes:
+        counts = Counter(
+            node.name
+            for node in body
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+            and node.name.startswith("test")
+        )
+        duplicates.extend(f"{prefix}{name}" for name, count in counts.items() if count > 1)
+    return duplicates
+
+
+def pytest_collection_modifyitems(
+    session: pytest.Session, config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Fail collection when a test module defines the same test twice.
+
+    Args:
+        session: Active pytest session (unused).
+        config: Pytest configuration (unused).
+        items: Collected test items.
+
+    Raises:
+        pytest.UsageError: If any collected module shadows one of its own tests.
+    """
+    modules = sorted({item.path for item in items})
+    duplicates = [f"{path.name}::{name}" for path in modules for name in _duplicate_test_names(path)]
+    if duplicates:
+        raise pytest.UsageError(f"Duplicate test definitions: {', '.join(duplicates)}")
+
+
+@pytest.fixture(scope="session")
+def database_template(tmp_path_factory: pytest.TempPathFactory) -> Generator[Path, None, None]:
+    """Run the application lifespan once, migrating a SQLite file each test copies.
+
+    Startup handlers create the schema against the template database; the
+    shutdown handlers run when the test session ends.
+
+    Yields:
+        Path: Location of the migrated template database.
+    """
+    template_path = tmp_path_factory.mktemp("db") / "template.db"
+
+    async def _startup() -> None:
+        """Run the startup handlers with the template database as the engine."""
+
+        engine = build_engine(f"sqlite+aiosqlite:///{template_path}")
+        original_engine = main_module.engine
+        main_module.engine = engine
+        try:
+            await app.router.startup()
+        finally:
+            main_module.engine = original_engine
+            await engine.dispose()
+
+    asyncio.run(_startup())
+    yield template_path
+    asyncio.run(app.router.shutdown())
+
+
 @pytest_asyncio.fixture
-async def client(tmp_path: Path) -> AsyncGenerator[SimpleAsyncClient, None]:
-    """Provide a test client backed by an isolated SQLite database.
+async def session_factory(
+    tmp_path: Path, database_template: Path
+) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    """Provide a session factory bound to a fresh copy of the template database.
 
     Yields:
-        SimpleAsyncClient: Client bound to the temporary application setup.
+        async_sessionmaker[AsyncSession]: Factory for sessions on the isolated database.
     """
     database_path = tmp_path / "test.db"
-    engine = create_async_engine(f"sqlite+aiosqlite:///{database_path}")
-    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    shutil.copyfile(database_template, database_path)
+    engine = build_engine(f"sqlite+aiosqlite:///{database_path}")
+    try:
+        yield async_sessionmaker(engine, expire_on_commit=False)
+    finally:
+        await engine.dispose()
+        if database_path.exists():
+            database_path.unlink()
+
+
+@pytest_asyncio.fixture
+async def client(
+    session_factory: async_sessionmaker[AsyncSession], monkeypatch: pytest.MonkeyPatch
+) -> AsyncGenerator[SimpleAsyncClient, None]:
+    """Provide a test client backed by an isolated SQLite database.
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    Password hashing and verification are memoized across the session for
+    requests made through this client.
 
-    original_engine = main_module.engine
-    main_module.engine = engine
+    Yields:
+        SimpleAsyncClient: Client bound to the temporary application setup.
+    """
+    monkeypatch.setattr(users_service, "get_password_hash", _memoized_password_hash)
+    monkeypatch.setattr(auth_service, "get_password_hash", _memoized_password_hash)
+    monkeypatch.setattr(auth_service, "verify_password", _memoized_verify_password)
 
     async def override_get_session() -> AsyncGenerator[AsyncSession, None]:
         """Yield sessions bound to the temporary test database.
@@ -233,27 +427,33 @@ async def client(tmp_path: Path) -> AsyncGenerator[SimpleAsyncClient, None]:
 
     app.dependency_overrides[get_session] = override_get_session
 
-    class _FakeSummarizationService:
-        """Deterministic summarization stub for tests."""
+    app.dependency_overrides[get_summarization_service] = lambda: _FAKE_SUMMARIZATION_SERVICE
+    try:
+        yield _CLIENT
+    finally:
+        app.dependency_overrides.clear()
 
-        async def summarize(self, text: str) -> str:
-            """Return a reproducible summary for the provided text."""
 
-            stripped = text.strip()
-            if not stripped:
-                raise ValueError("Text must not be empty")
-            return f"summary:{len(stripped)}"
+@pytest_asyncio.fixture
+async def seeded_owner(
+    client: SimpleAsyncClient, session_factory: async_sessionmaker[AsyncSession]
+) -> tuple[UserRead, dict[str, str]]:
+    """Create an account through the service layer and mint its access token in-process.
 
-    app.dependency_overrides[get_summarization_service] = lambda: _FakeSummarizationService()
+    Use this when a test needs an authenticated caller but is not about the
+    signup or login endpoints themselves.
 
-    await app.router.startup()
-    simple_client = SimpleAsyncClient(app)
-    try:
-        yield simple_client
-    finally:
-        await app.router.shutdown()
-        app.dependency_overrides.clear()
-        main_module.engine = original_engine
-        await engine.dispose()
-        if database_path.exists():
-            database_path.unlink()
+    Args:
+        client: Client fixture, requested so the application overrides are active.
+        session_factory: Factory for sessions on the test database.
+
+    Returns:
+        tuple[UserRead, dict[str, str]]: The created user and its ``Authorization`` headers.
+    """
+    user_in = UserCreate(name="Owner", email="owner@example.com", password="secret123")
+    async with session_factory() as session:
+        user = await users_service.create_user(session, user_in)
+    token = security.create_token(
+        user.email, auth_service._ACCESS_TOKEN_TTL, token_type="access"
+    )
+    return user, {"Authorization": f"Bearer {token}"}
@@ -12,6 +12,9 @@ if TYPE_CHECKING:
 async def test_metrics_endpoint_records_latency(client: "SimpleAsyncClient") -> None:
     """Ensure the Prometheus metrics endpoint reports latency histograms."""
 
+    tasks_response = await client.get("/tasks")
+    assert tasks_response.status_code == 401
+
     health_response = await client.get("/health")
     assert health_response.status_code == 200
 
@@ -19,3 +22,5 @@ async def test_metrics_endpoint_records_latency(client: "SimpleAsyncClient") ->
     assert metrics_response.status_code == 200
     body = metrics_response.text()
     assert "app_request_latency_seconds_bucket" in body
+    assert 'path="/tasks"' in body
+    assert 'path="/health"' not in body
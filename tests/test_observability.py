@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import logging
+import time
 from typing import TYPE_CHECKING
 
 import pytest
 
+from app.core import privacy
+from app.core import logging as app_logging
+from app.core import middleware
+from app.core.logging import _dumps, get_logger
 from app.core.privacy import hash_identifier
 
 if TYPE_CHECKING:
@@ -28,10 +36,150 @@ async def test_request_context_adds_request_id(client: "SimpleAsyncClient") -> N
         client: Async client fixture used to call the API.
     """
 
-    first_response = await client.get("/health")
-    second_response = await client.get("/health")
+    first_response = await client.get("/tasks")
+    second_response = await client.get("/tasks")
     first_request_id = first_response.headers.get("x-request-id")
     second_request_id = second_response.headers.get("x-request-id")
     assert first_request_id
     assert second_request_id
     assert first_request_id != second_request_id
+
+
+@pytest.mark.asyncio
+async def test_request_context_preserves_caller_request_id(client: "SimpleAsyncClient") -> None:
+    """Ensure a caller-supplied ``X-Request-ID`` header is echoed back unchanged.
+
+    Args:
+        client: Async client fixture used to call the API.
+    """
+
+    response = await client.get("/tasks", headers={"X-Request-ID": "upstream-123"})
+    assert response.headers.get("x-request-id") == "upstream-123"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_id", ["x" * 129, "bad id", "id\u00e9", "id;drop"])
+async def test_request_context_replaces_unsafe_caller_request_id(
+    client: "SimpleAsyncClient", request_id: str
+) -> None:
+    """Ensure oversized or unsafe caller request IDs are replaced with a generated one.
+
+    Args:
+        client: Async client fixture used to call the API.
+        request_id: Caller-supplied header value that must not be trusted.
+    """
+
+    response = await client.get("/tasks", headers={"X-Request-ID": request_id})
+    echoed = response.headers.get("x-request-id")
+    assert echoed
+    assert echoed != request_id
+    assert echoed.startswith(middleware._REQUEST_ID_PREFIX + "-")
+
+
+@pytest.mark.asyncio
+async def test_request_context_skips_health_probes(client: "SimpleAsyncClient") -> None:
+    """Ensure health probes bypass request-context instrumentation.
+
+    Args:
+        client: Async client fixture used to call the API.
+    """
+
+    response = await client.get("/health")
+    assert response.status_code == 200
+    assert "x-request-id" not in response.headers
+
+
+def test_hash_identifier_is_keyed_by_privacy_salt(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure a configured privacy salt changes the digest without changing its shape.
+
+    Args:
+        monkeypatch: Fixture used to swap the module-level hash key.
+    """
+
+    unkeyed = hash_identifier("user@example.com")
+    monkeypatch.setattr(privacy, "_HASH_KEY", privacy._hash_key("s" * 100))
+    keyed = hash_identifier("user@example.com")
+    assert keyed != unkeyed
+    assert len(keyed) == 12
+    assert keyed == hash_identifier("USER@example.com")
+
+
+def test_log_serializer_accepts_non_string_keys_and_wide_ints() -> None:
+    """Ensure payloads orjson rejects still serialize instead of raising in the caller."""
+
+    payload = {"counts": {1: 2}, "big": 2**70}
+    assert json.loads(_dumps(payload)) == {"counts": {"1": 2}, "big": 2**70}
+    get_logger(name=__name__).info("serializer_edge_cases", **payload)
+
+
+class _ExplodingLogger:
+    """Logger stand-in whose ``log`` always raises."""
+
+    def log(self, level: int, message: str) -> None:
+        """Fail to emit the record."""
+
+        raise RuntimeError("handler failed")
+
+
+def test_fallback_log_writer_survives_failing_records() -> None:
+    """Ensure records that cannot be serialized or emitted do not stop the writer thread."""
+
+    messages: list[str] = []
+
+    class _ListHandler(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            messages.append(record.getMessage())
+
+    target = logging.getLogger("tests.fallback_writer")
+    target.setLevel(logging.INFO)
+    handler = _ListHandler()
+    target.addHandler(handler)
+    try:
+        fallback = app_logging._FallbackLogger("tests.fallback_writer")
+        app_logging._ensure_log_writer()
+        app_logging._LOG_QUEUE.put(
+            (_ExplodingLogger(), logging.INFO, {"timestamp": time.time(), "event": "boom"})
+        )
+        fallback.info("unserializable", values={(1, 2): "tuple keys"})
+        fallback.info("after_failures")
+        deadline = time.monotonic() + 5
+        while len(messages) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        target.removeHandler(handler)
+
+    assert app_logging._LOG_WRITER is not None and app_logging._LOG_WRITER.is_alive()
+    assert [json.loads(message)["event"] for message in messages] == [
+        "unserializable",
+        "after_failures",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fallback_context_is_not_shared_with_spawned_tasks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Ensure binds in a spawned task and in its parent stay in their own scope.
+
+    Args:
+        monkeypatch: Fixture used to force the fallback logging path.
+    """
+
+    monkeypatch.setattr(app_logging, "structlog", None)
+    app_logging.clear_contextvars()
+    app_logging.bind_contextvars(request_id="parent")
+    parent_bound = asyncio.Event()
+
+    async def child() -> dict[str, object]:
+        app_logging.bind_contextvars(job="child")
+        await parent_bound.wait()
+        return dict(app_logging._REQUEST_CONTEXT.get())
+
+    try:
+        task = asyncio.create_task(child())
+        await asyncio.sleep(0)
+        app_logging.bind_contextvars(user_id=1)
+        parent_bound.set()
+        child_context = await task
+        assert child_context == {"request_id": "parent", "job": "child"}
+        assert app_logging._REQUEST_CONTEXT.get() == {"request_id": "parent", "user_id": 1}
+    finally:
+        app_logging.clear_contextvars()
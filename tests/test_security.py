@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import bcrypt
+import jwt
+import pytest
+from argon2 import PasswordHasher
+from sqlalchemy import select
+
+from app.core import security
+from app.core.security import (
+    create_token,
+    decode_token,
+    get_password_hash,
+    password_needs_rehash,
+    verify_dummy_password,
+    verify_password,
+)
+from app.models.user import User
+from app.services import auth as auth_service
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from tests.conftest import SimpleAsyncClient
+
+
+def test_password_hash_round_trip_uses_argon2id() -> None:
+    """Ensure new hashes use Argon2id and verify against the original password."""
+
+    hashed = get_password_hash("secret123")
+    assert hashed.startswith("$argon2id$")
+    assert verify_password("secret123", hashed)
+    assert not verify_password("wrong", hashed)
+    assert not password_needs_rehash(hashed)
+
+
+def test_legacy_bcrypt_hash_verifies_and_needs_rehash() -> None:
+    """Ensure bcrypt hashes from earlier releases still verify and are flagged for upgrade."""
+
+    legacy_hash = bcrypt.hashpw(b"secret123", bcrypt.gensalt(rounds=4)).decode("utf-8")
+    assert verify_password("secret123", legacy_hash)
+    assert not verify_password("wrong", legacy_hash)
+    assert password_needs_rehash(legacy_hash)
+
+
+@pytest.mark.asyncio
+async def test_login_upgrades_legacy_bcrypt_hash(
+    client: "SimpleAsyncClient", session_factory: "async_sessionmaker[AsyncSession]"
+) -> None:
+    """Ensure a successful login replaces a stored bcrypt hash with Argon2id.
+
+    Args:
+        client: Async client fixture for interacting with the API.
+        session_factory: Factory for sessions on the test database.
+    """
+    legacy_hash = bcrypt.hashpw(b"secret123", bcrypt.gensalt(rounds=4)).decode("utf-8")
+    async with session_factory() as session:
+        session.add(User(name="Legacy", email="legacy@example.com", hashed_password=legacy_hash))
+        await session.commit()
+
+    login_response = await client.post(
+        "/auth/login", json={"email": "legacy@example.com", "password": "secret123"}
+    )
+    assert login_response.status_code == 200
+
+    async with session_factory() as session:
+        stored_hash = await session.scalar(
+            select(User.hashed_password).where(User.email == "legacy@example.com")
+        )
+    assert stored_hash is not None and stored_hash.startswith("$argon2id$")
+    assert verify_password("secret123", stored_hash)
+
+
+@pytest.mark.asyncio
+async def test_login_with_unknown_email_checks_the_prepared_dummy_hash(
+    client: "SimpleAsyncClient", monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Ensure unknown accounts are rejected after verifying against the startup dummy hash.
+
+    Args:
+        client: Async client fixture for interacting with the API.
+        monkeypatch: Fixture used to record dummy verifications.
+    """
+    assert security._DUMMY_PASSWORD_HASH is not None
+    checked: list[str] = []
+
+    def _recording_verify_dummy_password(password: str) -> None:
+        checked.append(password)
+        verify_dummy_password(password)
+
+    monkeypatch.setattr(auth_service, "verify_dummy_password", _recording_verify_dummy_password)
+    login_response = await client.post(
+        "/auth/login", json={"email": "nobody@example.com", "password": "secret123"}
+    )
+    assert login_response.status_code == 401
+    assert checked == ["secret123"]
+
+
+def test_argon2_hash_with_outdated_parameters_needs_rehash() -> None:
+    """Ensure hashes made with weaker Argon2 costs are flagged for upgrade."""
+
+    current = security._PASSWORD_HASHER
+    weaker_hash = PasswordHasher(
+        time_cost=current.time_cost, memory_cost=current.memory_cost // 2, parallelism=1
+    ).hash("secret123")
+    assert verify_password("secret123", weaker_hash)
+    assert password_needs_rehash(weaker_hash)
+
+
+def test_argon2_hash_with_stronger_parameters_is_kept() -> None:
+    """Ensure hashes from a worker with higher costs or other parallelism are not rewritten."""
+
+    current = security._PASSWORD_HASHER
+    stronger_hash = PasswordHasher(
+        time_cost=current.time_cost + 1,
+        memory_cost=current.memory_cost * 2,
+        parallelism=current.parallelism + 1,
+    ).hash("secret123")
+    assert verify_password("secret123", stronger_hash)
+    assert not password_needs_rehash(stronger_hash)
+
+
+def test_verify_password_rejects_malformed_hash() -> None:
+    """Ensure unrecognized hash formats fail verification instead of raising."""
+
+    assert not verify_password("secret123", "not-a-hash")
+
+
+def test_calibrate_password_hasher_updates_hashing_parameters(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ensure calibration swaps in a hasher whose parameters new hashes use."""
+
+    monkeypatch.setattr(security, "_PASSWORD_HASHER", security._PASSWORD_HASHER)
+    monkeypatch.setattr(security, "_DUMMY_PASSWORD_HASH", None)
+    verify_dummy_password("secret123")
+    previous_hash = get_password_hash("secret123")
+    hasher = security.calibrate_password_hasher(target_ms=1)
+    assert hasher.time_cost >= security._ARGON2_MIN_TIME_COST
+    calibrated_hash = get_password_hash("secret123")
+    assert verify_password("secret123", previous_hash)
+    assert verify_password("secret123", calibrated_hash)
+    assert not password_needs_rehash(calibrated_hash)
+    assert security._DUMMY_PASSWORD_HASH is None
+    verify_dummy_password("secret123")
+    assert not password_needs_rehash(security._DUMMY_PASSWORD_HASH)
+
+
+def test_decode_token_cache_still_enforces_token_type() -> None:
+    """Ensure memoized decodes keep rejecting tokens of the wrong type."""
+
+    token = create_token("owner@example.com", timedelta(minutes=5), token_type="refresh")
+    assert decode_token(token, expected_type="refresh").sub == "owner@example.com"
+    assert decode_token(token, expected_type="refresh").sub == "owner@example.com"
+    with pytest.raises(ValueError):
+        decode_token(token, expected_type="access")
+    other = create_token("other@example.com", timedelta(minutes=5), token_type="refresh")
+    header, _, signature = token.split(".")
+    with pytest.raises(ValueError):
+        decode_token(".".join((header, other.split(".")[1], signature)))
+
+
+def test_create_token_matches_pyjwt_encoding() -> None:
+    """Ensure the hand-assembled token is byte-identical to ``jwt.encode`` output."""
+
+    token = create_token("owner@example.com", timedelta(minutes=5), token_type="access")
+    secret_key, algorithm = security._jwt_config()
+    claims = jwt.decode(token, secret_key, algorithms=[algorithm])
+    assert token == jwt.encode(claims, secret_key, algorithm=algorithm)
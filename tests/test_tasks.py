@@ -4,6 +4,7 @@ import pytest
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from app.models.schemas import UserRead
     from tests.conftest import SimpleAsyncClient
 
 
@@ -78,3 +79,36 @@ async def test_task_crud_and_permissions(client: "SimpleAsyncClient") -> None:
 
     missing_response = await client.get(f"/tasks/{task_id}", headers=owner_headers)
     assert missing_response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_partial_task_update_only_changes_provided_fields(
+    client: "SimpleAsyncClient", seeded_owner: tuple["UserRead", dict[str, str]]
+) -> None:
+    """Ensure a partial update leaves omitted and ``null`` fields untouched.
+
+    Args:
+        client: Async client fixture for interacting with the API.
+        seeded_owner: Authenticated caller created outside the HTTP layer.
+    """
+    _, headers = seeded_owner
+
+    task_payload = {"title": "Task 1", "description": "First task", "completed": False}
+    create_response = await client.post("/tasks", json=task_payload, headers=headers)
+    task_id = create_response.json()["id"]
+
+    update_response = await client.put(
+        f"/tasks/{task_id}", json={"completed": True, "description": None}, headers=headers
+    )
+    assert update_response.status_code == 200
+    assert update_response.json() == {
+        "id": task_id,
+        "title": "Task 1",
+        "description": "First task",
+        "completed": True,
+        "user_id": create_response.json()["user_id"],
+    }
+
+    noop_response = await client.put(f"/tasks/{task_id}", json={}, headers=headers)
+    assert noop_response.status_code == 200
+    assert noop_response.json() == update_response.json()
@@ -1,29 +1,60 @@
 from __future__ import annotations
 
+import asyncio
+from pathlib import Path
+
 import pytest
 from typing import TYPE_CHECKING
 
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app import main as main_module
+from app.models.database import Base, build_engine
+from app.models.user import EMAIL_LOWER_INDEX, User
+from app.services import users as users_service
+
 if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.models.schemas import UserRead
     from tests.conftest import SimpleAsyncClient
 
 
-@pytest.mark.asyncio
-async def test_user_crud_flow(client: "SimpleAsyncClient") -> None:
-    """Validate user CRUD endpoints end-to-end using the async client.
+async def _sign_up_and_log_in(
+    client: "SimpleAsyncClient", payload: dict[str, str]
+) -> tuple[int, dict[str, str]]:
+    """Register a user through the API and log them in.
 
     Args:
-        client: Async client fixture for interacting with the API.
+        client: Async client used to call the API.
+        payload: Signup payload with ``name``, ``email`` and ``password``.
+
+    Returns:
+        tuple[int, dict[str, str]]: The new user's id, taken from their own signup
+        response, and ``Authorization`` headers for their access token.
     """
-    owner_payload = {"name": "Owner", "email": "owner@example.com", "password": "secret123"}
-    signup_response = await client.post("/auth/signup", json=owner_payload)
+    signup_response = await client.post("/auth/signup", json=payload)
     assert signup_response.status_code == 201
-
     login_response = await client.post(
-        "/auth/login", json={"email": owner_payload["email"], "password": owner_payload["password"]}
+        "/auth/login", json={"email": payload["email"], "password": payload["password"]}
     )
     assert login_response.status_code == 200
-    owner_token = login_response.json()["access_token"]
-    headers = {"Authorization": f"Bearer {owner_token}"}
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    return signup_response.json()["id"], headers
+
+
+@pytest.mark.asyncio
+async def test_user_crud_flow(
+    client: "SimpleAsyncClient", seeded_owner: tuple["UserRead", dict[str, str]]
+) -> None:
+    """Validate user CRUD endpoints end-to-end using the async client.
+
+    Args:
+        client: Async client fixture for interacting with the API.
+        seeded_owner: Authenticated caller created outside the HTTP layer.
+    """
+    _, headers = seeded_owner
 
     new_user_payload = {"name": "Second", "email": "second@example.com", "password": "anothersecret"}
     create_response = await client.post("/users", json=new_user_payload, headers=headers)
@@ -32,12 +63,14 @@ async def test_user_crud_flow(client: "SimpleAsyncClient") -> None:
     created_user_id = created_user["id"]
     assert created_user["email"] == new_user_payload["email"]
 
-    list_response = await client.get("/users", headers=headers)
+    list_response, detail_response = await asyncio.gather(
+        client.get("/users", headers=headers),
+        client.get(f"/users/{created_user_id}", headers=headers),
+    )
     assert list_response.status_code == 200
     users = list_response.json()
     assert any(user["email"] == new_user_payload["email"] for user in users)
 
-    detail_response = await client.get(f"/users/{created_user_id}", headers=headers)
     assert detail_response.status_code == 200
     assert detail_response.json()["name"] == new_user_payload["name"]
 
@@ -68,10 +101,209 @@ async def test_refresh_token_cannot_access_resources(client: "SimpleAsyncClient"
     tokens = login_response.json()
 
     refresh_headers = {"Authorization": f"Bearer {tokens['refresh_token']}"}
-    protected_response = await client.get("/users", headers=refresh_headers)
+    protected_response, wrong_refresh_response = await asyncio.gather(
+        client.get("/users", headers=refresh_headers),
+        client.post("/auth/refresh", json={"refresh_token": tokens["access_token"]}),
+    )
     assert protected_response.status_code == 401
+    assert wrong_refresh_response.status_code == 401
+
 
-    wrong_refresh_response = await client.post(
-        "/auth/refresh", json={"refresh_token": tokens["access_token"]}
+@pytest.mark.asyncio
+async def test_deleted_user_token_is_rejected(
+    client: "SimpleAsyncClient", seeded_owner: tuple["UserRead", dict[str, str]]
+) -> None:
+    """Ensure deleting a user stops their existing tokens from authenticating.
+
+    Args:
+        client: Async client fixture for interacting with the API.
+        seeded_owner: Authenticated caller who performs the deletion.
+    """
+    _, owner_headers = seeded_owner
+    other_payload = {"name": "Other", "email": "other@example.com", "password": "secret456"}
+    other_id, other_headers = await _sign_up_and_log_in(client, other_payload)
+    assert (await client.get("/tasks", headers=other_headers)).status_code == 200
+
+    delete_response = await client.delete(f"/users/{other_id}", headers=owner_headers)
+    assert delete_response.status_code == 204
+
+    assert (await client.get("/tasks", headers=other_headers)).status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_token_is_rejected_after_user_is_deleted_elsewhere(
+    client: "SimpleAsyncClient", session_factory: "async_sessionmaker[AsyncSession]"
+) -> None:
+    """Ensure a user deleted outside this worker's service layer stops authenticating.
+
+    Args:
+        client: Async client fixture for interacting with the API.
+        session_factory: Factory for sessions on the test database.
+    """
+    payload = {"name": "Other", "email": "other@example.com", "password": "secret456"}
+    user_id, headers = await _sign_up_and_log_in(client, payload)
+    assert (await client.get("/tasks", headers=headers)).status_code == 200
+
+    async with session_factory() as session:
+        await session.execute(text("DELETE FROM users WHERE id = :id"), {"id": user_id})
+        await session.commit()
+
+    assert (await client.get("/tasks", headers=headers)).status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_email_lookup_ignores_case(client: "SimpleAsyncClient") -> None:
+    """Ensure logins and duplicate checks treat emails case-insensitively.
+
+    Args:
+        client: Async client fixture for interacting with the API.
+    """
+    payload = {"name": "Owner", "email": "Owner@Example.com", "password": "secret123"}
+    signup_response = await client.post("/auth/signup", json=payload)
+    assert signup_response.status_code == 201
+
+    login_response = await client.post(
+        "/auth/login", json={"email": "owner@example.com", "password": payload["password"]}
     )
-    assert wrong_refresh_response.status_code == 401
+    assert login_response.status_code == 200
+
+    duplicate_payload = {**payload, "email": "OWNER@example.com"}
+    duplicate_response = await client.post("/auth/signup", json=duplicate_payload)
+    assert duplicate_response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_non_ascii_email_can_log_in(client: "SimpleAsyncClient") -> None:
+    """Ensure an address with a non-ASCII uppercase letter logs in as registered.
+
+    Args:
+        client: Async client fixture for interacting with the API.
+    """
+    payload = {"name": "Ünal", "email": "Ünal@example.com", "password": "secret123"}
+    signup_response = await client.post("/auth/signup", json=payload)
+    assert signup_response.status_code == 201
+
+    for email in (payload["email"], "ÜNAL@EXAMPLE.COM"):
+        login_response = await client.post(
+            "/auth/login", json={"email": email, "password": payload["password"]}
+        )
+        assert login_response.status_code == 200
+        headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+        assert (await client.get("/tasks", headers=headers)).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_startup_adds_email_index_to_existing_database(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Ensure startup creates the ``lower(email)`` index on databases that predate it.
+
+    Args:
+        tmp_path: Directory holding the legacy database.
+        monkeypatch: Fixture used to point startup at the legacy database.
+    """
+    engine = build_engine(f"sqlite+aiosqlite:///{tmp_path / 'legacy.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(text(f"DROP INDEX {EMAIL_LOWER_INDEX.name}"))
+    monkeypatch.setattr(main_module, "engine", engine)
+    try:
+        await main_module.on_startup()
+        async with engine.connect() as conn:
+            index_names = await conn.scalars(
+                text("SELECT name FROM sqlite_master WHERE type = 'index'")
+            )
+            assert EMAIL_LOWER_INDEX.name in set(index_names)
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_case_variant_emails_from_existing_database_stay_separate(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Ensure accounts differing only in email case never resolve to each other.
+
+    Such rows can exist in databases created before the ``lower(email)`` index,
+    which startup then cannot add.
+
+    Args:
+        tmp_path: Directory holding the legacy database.
+        monkeypatch: Fixture used to point startup at the legacy database.
+    """
+    engine = build_engine(f"sqlite+aiosqlite:///{tmp_path / 'legacy.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(text(f"DROP INDEX {EMAIL_LOWER_INDEX.name}"))
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        lower = User(name="Bob", email="bob@x.com", hashed_password="unused")
+        mixed = User(name="Other Bob", email="Bob@x.com", hashed_password="unused")
+        session.add_all([lower, mixed])
+        await session.commit()
+    monkeypatch.setattr(main_module, "engine", engine)
+    try:
+        await main_module.on_startup()
+        async with session_factory() as session:
+            for user in (lower, mixed):
+                assert await users_service.get_user_id_by_email(session, user.email) == user.id
+                found = await users_service.get_user_by_email(session, user.email)
+                assert found is not None and found.id == user.id
+            assert await users_service.get_user_id_by_email(session, "BOB@X.COM") is None
+            assert await users_service.get_user_by_email(session, "BOB@X.COM") is None
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_deleting_user_removes_their_tasks(
+    client: "SimpleAsyncClient", seeded_owner: tuple["UserRead", dict[str, str]]
+) -> None:
+    """Ensure tasks are cascaded away with their owner and not inherited by a new account.
+
+    Args:
+        client: Async client fixture for interacting with the API.
+        seeded_owner: Authenticated caller who performs the deletion.
+    """
+    _, owner_headers = seeded_owner
+    other_payload = {"name": "Other", "email": "other@example.com", "password": "secret456"}
+    other_id, other_headers = await _sign_up_and_log_in(client, other_payload)
+    task_payload = {"title": "Task", "description": "Owned by other", "completed": False}
+    assert (await client.post("/tasks", json=task_payload, headers=other_headers)).status_code == 201
+
+    assert (await client.delete(f"/users/{other_id}", headers=owner_headers)).status_code == 204
+    assert (await client.delete(f"/users/{other_id}", headers=owner_headers)).status_code == 404
+
+    _, replacement_headers = await _sign_up_and_log_in(client, other_payload)
+    tasks_response = await client.get("/tasks", headers=replacement_headers)
+    assert tasks_response.status_code == 200
+    assert tasks_response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_update_user_ignores_null_fields(client: "SimpleAsyncClient") -> None:
+    """Ensure explicit ``null`` fields are left untouched while the rest are applied.
+
+    Args:
+        client: Async client fixture for interacting with the API.
+    """
+    payload = {"name": "Owner", "email": "owner@example.com", "password": "secret123"}
+    user_id, headers = await _sign_up_and_log_in(client, payload)
+
+    update_response = await client.put(
+        f"/users/{user_id}",
+        json={"name": None, "email": None, "password": "newpass456"},
+        headers=headers,
+    )
+    assert update_response.status_code == 200
+    assert update_response.json()["name"] == payload["name"]
+    assert update_response.json()["email"] == payload["email"]
+
+    old_login = await client.post(
+        "/auth/login", json={"email": payload["email"], "password": payload["password"]}
+    )
+    assert old_login.status_code == 401
+    new_login = await client.post(
+        "/auth/login", json={"email": payload["email"], "password": "newpass456"}
+    )
+    assert new_login.status_code == 200